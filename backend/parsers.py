@@ -5,6 +5,7 @@ Parser for 23andMe raw data files.
 from typing import List, Tuple
 import os
 
+from config import VALID_CHROMOSOMES, GENOTYPE_UNDETERMINED
 from models.data_models import SNPRecord
 from backend.validators import validate_23andme_line
 from utils.logging_config import get_logger
@@ -12,6 +13,14 @@ from utils.file_utils import validate_file_exists
 
 logger = get_logger(__name__)
 
+# Lines in the plain layout (rs ID, known chromosome, ASCII position, two
+# ACGT bases) are checked inline; anything else goes through the validator
+_CHROMOSOMES = frozenset(VALID_CHROMOSOMES)
+_GENOTYPES = frozenset(a + b for a in 'ACGT' for b in 'ACGT')
+
+# Lines between progress callbacks
+PROGRESS_INTERVAL = 10_000
+
 
 class ParseError(Exception):
     """Exception raised when parsing fails completely."""
@@ -65,52 +74,74 @@ class Parser23andMe:
         if not validate_file_exists(filepath):
             raise ParseError(f"File not found or not readable: {filepath}")
         
-        # Count total lines first
+        # One read for the whole file; the line count for progress comes from
+        # the same buffer instead of a second pass over the file
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                total_lines = sum(1 for _ in f)
+                lines = f.read().split('\n')
+        except UnicodeDecodeError as e:
+            raise ParseError(f"File encoding error: {str(e)}")
         except IOError as e:
             raise ParseError(f"Error reading file: {str(e)}")
         
+        # A trailing newline ends the last line rather than starting another
+        if lines[-1] == '':
+            lines.pop()
+        total_lines = len(lines)
+        
         records: List[SNPRecord] = []
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, start=1):
-                    self.total_lines += 1
-                    
-                    # Report progress
-                    if self.progress_callback:
-                        self.progress_callback(self.total_lines, total_lines)
-                    
-                    success, data, message = validate_23andme_line(line, line_num)
-                    
-                    if not success:
-                        if message:
-                            if 'Undetermined' in message:
-                                self.skipped_undetermined += 1
-                            elif message:
-                                self.warnings.append(message)
+        for line_num, line in enumerate(lines, start=1):
+            # Report progress
+            if self.progress_callback and line_num % PROGRESS_INTERVAL == 0:
+                self.progress_callback(line_num, total_lines)
+            
+            parts = line.split()
+            if len(parts) >= 4:
+                rsid, chromosome, position, genotype = parts[0], parts[1], parts[2], parts[3]
+                if (rsid[:2] == 'rs' and rsid[2:].isdecimal() and
+                        chromosome in _CHROMOSOMES and
+                        position.isascii() and position.isdigit() and
+                        int(position) > 0):
+                    if genotype in _GENOTYPES:
+                        records.append(SNPRecord(
+                            rsid=rsid,
+                            chromosome=chromosome,
+                            position=int(position),
+                            genotype=genotype
+                        ))
+                        continue
+                    if genotype == GENOTYPE_UNDETERMINED:
+                        self.skipped_undetermined += 1
                         continue
-                    
-                    try:
-                        record = SNPRecord(
-                            rsid=data['rsid'],
-                            chromosome=data['chromosome'],
-                            position=data['position'],
-                            genotype=data['genotype']
-                        )
-                        records.append(record)
-                        self.valid_lines += 1
-                    except ValueError as e:
-                        msg = f"Line {line_num}: {str(e)}"
-                        self.warnings.append(msg)
-                        logger.warning(msg)
+            
+            success, data, message = validate_23andme_line(line, line_num)
+            
+            if not success:
+                if message:
+                    if 'Undetermined' in message:
+                        self.skipped_undetermined += 1
+                    elif message:
+                        self.warnings.append(message)
+                continue
+            
+            try:
+                record = SNPRecord(
+                    rsid=data['rsid'],
+                    chromosome=data['chromosome'],
+                    position=data['position'],
+                    genotype=data['genotype']
+                )
+                records.append(record)
+            except ValueError as e:
+                msg = f"Line {line_num}: {str(e)}"
+                self.warnings.append(msg)
+                logger.warning(msg)
         
-        except UnicodeDecodeError as e:
-            raise ParseError(f"File encoding error: {str(e)}")
-        except IOError as e:
-            raise ParseError(f"Error reading file: {str(e)}")
+        self.total_lines = total_lines
+        self.valid_lines = len(records)
+        if self.progress_callback:
+            self.progress_callback(total_lines, total_lines)
         
         if not records:
             raise ParseError("No valid SNP records found in file")
@@ -157,3 +188,4 @@ def parse_23andme_file(filepath: str) -> Tuple[List[SNPRecord], dict]:
     records = parser.parse_file(filepath)
     stats = parser.get_parse_stats()
     return records, stats
+
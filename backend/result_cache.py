@@ -0,0 +1,191 @@
+"""
+Cache of processed 23andMe files.
+
+Stores the parsed SNP records, GWAS matches and parse statistics of recent
+analyses, keyed by the genotype file contents and the GWAS database they
+were matched against, so re-opening the same file skips parsing and matching.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from models.data_models import SNPRecord, GWASMatch
+from config import RESULT_CACHE_PATH, RESULT_CACHE_MAX_ENTRIES
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when SNPRecord, GWASMatch or the matching logic change shape
+CACHE_FORMAT_VERSION = "2"
+
+# Read size for hashing genotype files where hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of analysis results.
+    
+    Entries are pickled into a single BLOB per key. Only the most recently
+    used RESULT_CACHE_MAX_ENTRIES entries are kept. Cache failures are
+    logged and treated as misses; they never stop an analysis.
+    """
+    
+    def __init__(self, cache_path: Optional[str] = None,
+                 max_entries: int = RESULT_CACHE_MAX_ENTRIES) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_path: Path to the cache database. Uses config default if None.
+            max_entries: Number of analyses to keep.
+        """
+        self.cache_path = cache_path or RESULT_CACHE_PATH
+        self.max_entries = max_entries
+    
+    @staticmethod
+    def make_key(filepath: str, db_path: str) -> str:
+        """
+        Build the cache key for a genotype file matched against a database.
+        
+        The file is identified by its SHA-256 digest, so a renamed or copied
+        file still hits. The database is identified by its size and
+        modification time, which change on every update.
+        
+        Args:
+            filepath: Path to the 23andMe file.
+            db_path: Path to the GWAS database.
+        
+        Returns:
+            str: Cache key.
+        
+        Raises:
+            OSError: If either file cannot be read.
+        """
+        with open(filepath, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: reads into one reused buffer and hashes without the GIL
+                digest = hashlib.file_digest(f, 'sha256')
+            else:
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        
+        db_stat = os.stat(db_path)
+        return (
+            f"{CACHE_FORMAT_VERSION}:{digest.hexdigest()}:"
+            f"{db_stat.st_size}:{db_stat.st_mtime_ns}"
+        )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating its table if needed."""
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.cache_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                cache_key TEXT PRIMARY KEY,
+                last_used REAL NOT NULL,
+                data BLOB NOT NULL
+            )
+        """)
+        return conn
+    
+    def get(self, key: str) -> Optional[Tuple[List[SNPRecord], List[GWASMatch], Dict[str, Any]]]:
+        """
+        Look up a cached analysis.
+        
+        Args:
+            key: Key from make_key().
+        
+        Returns:
+            Tuple of (snp_records, matches, stats), or None on a miss.
+        """
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT data FROM results WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                conn.execute(
+                    "UPDATE results SET last_used = ? WHERE cache_key = ?", (time.time(), key)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Error reading result cache: {e}")
+            return None
+        
+        # Unpickling creates ~1M objects in one go; collections triggered
+        # along the way only rescan them and more than double the load time
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snp_records, matches, stats = pickle.loads(row[0])
+        except Exception as e:
+            # Pickles from an older code layout can fail in many ways
+            # (AttributeError, ModuleNotFoundError, ...); drop the entry
+            logger.warning(f"Discarding unreadable result cache entry: {e}")
+            self._delete(key)
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        logger.info(f"Result cache hit: {len(snp_records):,} SNPs, {len(matches):,} matches")
+        return snp_records, matches, stats
+    
+    def _delete(self, key: str) -> None:
+        """Remove an entry; failures are only logged."""
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM results WHERE cache_key = ?", (key,))
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Error writing result cache: {e}")
+    
+    def put(self, key: str, snp_records: List[SNPRecord], matches: List[GWASMatch],
+            stats: Dict[str, Any]) -> bool:
+        """
+        Store an analysis, evicting the least recently used entries.
+        
+        Args:
+            key: Key from make_key().
+            snp_records: Parsed SNP records.
+            matches: GWAS matches for the records.
+            stats: Parse statistics.
+        
+        Returns:
+            bool: True if the entry was stored.
+        """
+        try:
+            data = pickle.dumps((snp_records, matches, stats), protocol=pickle.HIGHEST_PROTOCOL)
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (cache_key, last_used, data) VALUES (?, ?, ?)",
+                        (key, time.time(), data)
+                    )
+                    conn.execute("""
+                        DELETE FROM results WHERE cache_key NOT IN (
+                            SELECT cache_key FROM results ORDER BY last_used DESC LIMIT ?
+                        )
+                    """, (self.max_entries,))
+            finally:
+                conn.close()
+            return True
+        except Exception as e:
+            # Pickling can also fail with AttributeError or RecursionError
+            logger.warning(f"Error writing result cache: {e}")
+            return False
@@ -3,12 +3,13 @@ Search engine for matching user SNPs against GWAS database.
 """
 
 import sqlite3
-from typing import List, Optional, Dict, Any
+import numpy as np
+from typing import List, Optional, Dict, Any, Callable
 from contextlib import contextmanager
 
 from models.data_models import SNPRecord, GWASMatch, FilterCriteria
 from backend.scoring import calculate_impact_score
-from config import DATABASE_PATH, DEFAULT_ALLELE_FREQUENCY
+from config import DATABASE_PATH, DEFAULT_ALLELE_FREQUENCY, SQLITE_MMAP_SIZE
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -53,6 +54,8 @@ class SearchEngine:
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
+            # Serve pages straight from the OS page cache instead of read() calls
+            conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
             yield conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
@@ -76,7 +79,7 @@ class SearchEngine:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='gwas_variants'"
+                    "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') AND name='gwas_variants'"
                 )
                 if not cursor.fetchone():
                     logger.error("Missing table: gwas_variants")
@@ -93,12 +96,20 @@ class SearchEngine:
         except DatabaseError:
             return False
     
-    def match_user_snps(self, user_snps: List[SNPRecord]) -> List[GWASMatch]:
+    def match_user_snps(
+        self,
+        user_snps: List[SNPRecord],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> List[GWASMatch]:
         """
         Match a list of user SNPs against the GWAS database.
         
         Args:
             user_snps: List of SNP records from user's 23andMe file.
+            progress_callback: Called after each batch with (snps_matched, total_snps).
+            should_cancel: Checked before each batch; matching stops early and
+                returns the matches found so far once it returns True.
             
         Returns:
             List[GWASMatch]: List of GWAS matches found.
@@ -120,6 +131,10 @@ class SearchEngine:
                 cursor = conn.cursor()
                 
                 for i in range(0, len(rsids), BATCH_SIZE):
+                    if should_cancel and should_cancel():
+                        logger.info("SNP matching cancelled")
+                        break
+                    
                     batch_rsids = rsids[i:i + BATCH_SIZE]
                     
                     placeholders = ','.join('?' * len(batch_rsids))
@@ -143,35 +158,30 @@ class SearchEngine:
                     
                     params = [DEFAULT_ALLELE_FREQUENCY] + batch_rsids
                     cursor.execute(query, params)
+                    rows = cursor.fetchall()
                     
-                    for row in cursor.fetchall():
+                    for row, impact_score in zip(rows, self._impact_scores(rows)):
                         rsid = row['variant_id']
-                        user_genotype = rsid_to_genotype.get(rsid, '')
-                        
-                        p_value = row['p_value']
-                        af = row['af_overall']
-                        
-                        try:
-                            impact_score = calculate_impact_score(p_value, af)
-                        except ValueError:
-                            impact_score = 5.0
                         
                         match = GWASMatch(
                             rsid=rsid,
                             chromosome=row['chromosome'],
                             position=row['position'],
-                            user_genotype=user_genotype,
+                            user_genotype=rsid_to_genotype.get(rsid, ''),
                             gene=row['mapped_gene'],
                             trait=row['reported_trait'],
                             risk_allele=row['risk_allele'],
-                            p_value=p_value,
+                            p_value=row['p_value'],
                             odds_ratio=row['odds_ratio'],
                             sample_size=row['sample_size'],
                             category=row['category'],
-                            allele_frequency=af,
+                            allele_frequency=row['af_overall'],
                             impact_score=impact_score
                         )
                         matches.append(match)
+                    
+                    if progress_callback:
+                        progress_callback(i + len(batch_rsids), len(rsids))
                 
                 logger.info(f"Found {len(matches)} GWAS matches")
                 return matches
@@ -180,6 +190,29 @@ class SearchEngine:
             logger.error(f"Database query error: {e}")
             raise DatabaseError(f"Failed to query database: {e}")
     
+    @staticmethod
+    def _impact_scores(rows: List[sqlite3.Row]) -> List[float]:
+        """
+        Score a batch of matched rows with one vectorized call.
+        
+        Rows whose p-value or allele frequency is out of range get a score
+        of 5.0, as a scalar ValueError from calculate_impact_score would.
+        
+        Args:
+            rows: Query rows with p_value and af_overall columns.
+        
+        Returns:
+            List[float]: Impact score for each row, in order.
+        """
+        p_values = np.array([row['p_value'] for row in rows], dtype=float)
+        afs = np.array([row['af_overall'] for row in rows], dtype=float)
+        
+        scores = np.full(len(rows), 5.0)
+        valid = (p_values > 0) & (p_values <= 1) & (afs >= 0) & (afs <= 1)
+        if valid.any():
+            scores[valid] = calculate_impact_score(p_values[valid], afs[valid])
+        return scores.tolist()
+    
     def search_text(self, search_term: str, matches: List[GWASMatch]) -> List[GWASMatch]:
         """
         Filter matches by text search in traits and genes.
@@ -12,6 +12,11 @@ DATABASE_PATH = os.path.join(BASE_DIR, 'database', 'gwas.db')
 PGS_DATABASE_PATH = os.path.join(BASE_DIR, 'database', 'pgs.db')
 BACKUP_DIR = os.path.join(BASE_DIR, 'database', 'backups')
 LOG_DIR = os.path.join(BASE_DIR, 'logs')
+RESULT_CACHE_PATH = os.path.join(BASE_DIR, 'database', 'result_cache.db')
+
+# SQLite tuning
+SQLITE_PAGE_SIZE = 8192
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # 256MB
 
 # Logging configuration
 LOG_LEVEL = logging.DEBUG
@@ -21,6 +26,9 @@ LOG_BACKUP_COUNT = 5
 # Pagination
 RESULTS_PER_PAGE = 50
 
+# Number of processed genotype files kept in the result cache
+RESULT_CACHE_MAX_ENTRIES = 5
+
 # Default values for scoring
 DEFAULT_ALLELE_FREQUENCY = 0.5
 DEFAULT_IMPACT_SCORE = 5.0
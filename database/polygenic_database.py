@@ -11,10 +11,15 @@ import sqlite3
 import os
 import shutil
 import hashlib
+import heapq
 import json
+import queue
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
 from contextlib import contextmanager
+from dataclasses import replace
+from operator import itemgetter
+from urllib.request import pathname2url
 
 from models.polygenic_models import (
     PolygenicScore, PolygenicVariant, PopulationDistribution,
@@ -35,6 +40,132 @@ class PolygenicDatabaseError(Exception):
     pass
 
 
+def _connect_readonly(db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open a read-only connection without creating the file if it is missing.
+    
+    Raises:
+        sqlite3.OperationalError: If the database file cannot be opened.
+    """
+    uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+
+
+class _ReadConnectionPool:
+    """
+    Pool of read-only connections to a single database file.
+    
+    Connections are checked out exclusively, so they can be shared between
+    the UI thread and worker threads without re-opening the file per query.
+    """
+    
+    def __init__(self, db_path: str, size: int = 4) -> None:
+        self.db_path = db_path
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+    
+    @contextmanager
+    def connection(self):
+        """Check out a read-only connection, returning it to the pool afterwards."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = _connect_readonly(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# Successful GWAS version reads per database path, with the file state
+# (see _gwas_file_state) they were read under
+_gwas_version_cache: Dict[str, Tuple[tuple, DatabaseVersion]] = {}
+
+
+def _gwas_file_state(db_path: str) -> tuple:
+    """
+    Size and modification time of a database and its WAL file.
+    
+    In WAL mode commits only reach the main file at checkpoint, so the WAL
+    file's stat is part of the state.
+    
+    Raises:
+        FileNotFoundError: If the database file does not exist.
+    """
+    stat = os.stat(db_path)
+    try:
+        wal_stat = os.stat(db_path + '-wal')
+        wal_state = (wal_stat.st_size, wal_stat.st_mtime_ns)
+    except FileNotFoundError:
+        wal_state = None
+    return stat.st_size, stat.st_mtime_ns, wal_state
+
+
+def _load_gwas_version(db_path: str, mtime_ns: int) -> Optional[DatabaseVersion]:
+    """Read GWAS version info from the database file."""
+    try:
+        conn = _connect_readonly(db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='database_versions'
+        """)
+        if not cursor.fetchone():
+            # Legacy database without version tracking
+            cursor.execute("SELECT COUNT(*) FROM gwas_variants")
+            count = cursor.fetchone()[0]
+            conn.close()
+            return DatabaseVersion(
+                database_name="gwas_catalog",
+                version="1.0.0",
+                release_date=None,
+                download_date=datetime.fromtimestamp(mtime_ns / 1e9),
+                source_url="https://www.ebi.ac.uk/gwas/",
+                record_count=count
+            )
+        
+        cursor.execute("""
+            SELECT * FROM database_versions WHERE database_name = 'gwas_catalog'
+        """)
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row:
+            return None
+        
+        # sqlite3.Row has no .get(); older version tables may lack checksum
+        columns = row.keys()
+        
+        return DatabaseVersion(
+            database_name=row['database_name'],
+            version=row['version'],
+            release_date=datetime.fromisoformat(row['release_date']) if row['release_date'] else None,
+            download_date=datetime.fromisoformat(row['download_date']),
+            source_url=row['source_url'],
+            record_count=row['record_count'],
+            checksum=row['checksum'] if 'checksum' in columns else None
+        )
+    except sqlite3.Error as e:
+        if isinstance(e, sqlite3.OperationalError) and str(e).startswith("unable to open"):
+            # Database not installed yet
+            return None
+        logger.error(f"Error getting GWAS version: {e}")
+        return None
+
+
 class PolygenicDatabase:
     """
     Database manager for polygenic scores.
@@ -53,6 +184,7 @@ class PolygenicDatabase:
             db_path: Path to the database file. Uses default if None.
         """
         self.db_path = db_path or PGS_DATABASE_PATH
+        self._read_pool = _ReadConnectionPool(self.db_path)
         self._ensure_database()
     
     @contextmanager
@@ -70,6 +202,20 @@ class PolygenicDatabase:
             if conn:
                 conn.close()
     
+    @contextmanager
+    def _get_read_connection(self):
+        """Context manager for pooled read-only connections."""
+        try:
+            with self._read_pool.connection() as conn:
+                yield conn
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            raise PolygenicDatabaseError(f"Database error: {e}")
+    
+    def close(self) -> None:
+        """Close pooled read connections."""
+        self._read_pool.close()
+    
     def _ensure_database(self) -> None:
         """Ensure database exists with required schema."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -664,15 +810,30 @@ class PolygenicDatabase:
         
         return distributions
     
-    def _set_version(self, db_name: str, version: str, source_url: str) -> None:
-        """Set version info for a database."""
+    def _set_version(
+        self,
+        db_name: str,
+        version: str,
+        source_url: str,
+        now_iso: Optional[str] = None
+    ) -> None:
+        """
+        Set version info for a database.
+        
+        Args:
+            db_name: Database name.
+            version: Version string.
+            source_url: Where the data was downloaded from.
+            now_iso: Download timestamp in ISO format. Callers updating several
+                databases in one batch can compute it once and pass it in.
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO database_versions
                 (database_name, version, download_date, source_url, record_count)
                 VALUES (?, ?, ?, ?, (SELECT COUNT(*) FROM polygenic_scores))
-            """, (db_name, version, datetime.now().isoformat(), source_url))
+            """, (db_name, version, now_iso or datetime.now().isoformat(), source_url))
             conn.commit()
     
     def get_version(self, db_name: str) -> Optional[DatabaseVersion]:
@@ -685,7 +846,7 @@ class PolygenicDatabase:
         Returns:
             DatabaseVersion or None.
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT database_name, version, release_date, download_date,
@@ -718,7 +879,7 @@ class PolygenicDatabase:
     
     def get_score_count(self) -> int:
         """Get total number of complete polygenic scores."""
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM polygenic_scores WHERE download_status = 'complete'")
             return cursor.fetchone()[0]
@@ -736,54 +897,27 @@ class DatabaseVersionManager:
         os.makedirs(BACKUP_DIR, exist_ok=True)
     
     def get_gwas_version(self) -> Optional[DatabaseVersion]:
-        """Get GWAS database version info."""
-        if not os.path.exists(self.gwas_db_path):
-            return None
+        """
+        Get GWAS database version info.
         
+        Successful lookups are cached on the size and modification time of
+        the file and its WAL, so repeated calls against an unchanged database
+        only cost two stat() calls. Each call returns its own copy.
+        """
         try:
-            conn = sqlite3.connect(self.gwas_db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='database_versions'
-            """)
-            if not cursor.fetchone():
-                # Legacy database without version tracking
-                cursor.execute("SELECT COUNT(*) FROM gwas_variants")
-                count = cursor.fetchone()[0]
-                conn.close()
-                return DatabaseVersion(
-                    database_name="gwas_catalog",
-                    version="1.0.0",
-                    release_date=None,
-                    download_date=datetime.fromtimestamp(os.path.getmtime(self.gwas_db_path)),
-                    source_url="https://www.ebi.ac.uk/gwas/",
-                    record_count=count
-                )
-            
-            cursor.execute("""
-                SELECT * FROM database_versions WHERE database_name = 'gwas_catalog'
-            """)
-            row = cursor.fetchone()
-            conn.close()
-            
-            if not row:
-                return None
-            
-            return DatabaseVersion(
-                database_name=row['database_name'],
-                version=row['version'],
-                release_date=datetime.fromisoformat(row['release_date']) if row['release_date'] else None,
-                download_date=datetime.fromisoformat(row['download_date']),
-                source_url=row['source_url'],
-                record_count=row['record_count'],
-                checksum=row.get('checksum')
-            )
-        except sqlite3.Error as e:
-            logger.error(f"Error getting GWAS version: {e}")
+            state = _gwas_file_state(self.gwas_db_path)
+        except FileNotFoundError:
             return None
+        
+        cached = _gwas_version_cache.get(self.gwas_db_path)
+        if cached is not None and cached[0] == state:
+            return replace(cached[1])
+        
+        version = _load_gwas_version(self.gwas_db_path, state[1])
+        if version is None:
+            return None
+        _gwas_version_cache[self.gwas_db_path] = (state, version)
+        return replace(version)
     
     def get_pgs_version(self) -> Optional[DatabaseVersion]:
         """Get PGS database version info."""
@@ -799,9 +933,6 @@ class DatabaseVersionManager:
         Returns:
             Path to backup file, or None if failed.
         """
-        if not os.path.exists(db_path):
-            return None
-        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         db_name = os.path.basename(db_path)
         backup_path = os.path.join(BACKUP_DIR, f"{db_name}.{timestamp}.bak")
@@ -810,6 +941,8 @@ class DatabaseVersionManager:
             shutil.copy2(db_path, backup_path)
             logger.info(f"Created backup: {backup_path}")
             return backup_path
+        except FileNotFoundError:
+            return None
         except IOError as e:
             logger.error(f"Failed to create backup: {e}")
             return None
@@ -833,9 +966,12 @@ class DatabaseVersionManager:
             logger.error(f"Failed to restore backup: {e}")
             return False
     
-    def list_backups(self) -> List[Tuple[str, datetime]]:
+    def list_backups(self, limit: Optional[int] = None) -> List[Tuple[str, datetime]]:
         """
-        List available backups.
+        List available backups, most recent first.
+        
+        Args:
+            limit: Return only the N most recent backups. Returns all if None.
         
         Returns:
             List of (backup_path, timestamp) tuples.
@@ -844,22 +980,25 @@ class DatabaseVersionManager:
         if not os.path.exists(BACKUP_DIR):
             return backups
         
-        for filename in os.listdir(BACKUP_DIR):
-            if filename.endswith('.bak'):
-                filepath = os.path.join(BACKUP_DIR, filename)
-                mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-                backups.append((filepath, mtime))
+        with os.scandir(BACKUP_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.bak'):
+                    mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                    backups.append((entry.path, mtime))
         
-        return sorted(backups, key=lambda x: x[1], reverse=True)
+        if limit is not None:
+            return heapq.nlargest(limit, backups, key=itemgetter(1))
+        return sorted(backups, key=itemgetter(1), reverse=True)
 
 
 def get_gwas_database_stats() -> Dict[str, int]:
     """Get statistics about the GWAS database."""
-    if not os.path.exists(DATABASE_PATH):
+    try:
+        conn = _connect_readonly(DATABASE_PATH)
+    except sqlite3.Error:
         return {'variants': 0, 'traits': 0, 'genes': 0}
     
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
         cursor = conn.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM gwas_variants")
@@ -871,7 +1010,8 @@ def get_gwas_database_stats() -> Dict[str, int]:
         cursor.execute("SELECT COUNT(DISTINCT mapped_gene) FROM gwas_variants")
         genes = cursor.fetchone()[0]
         
-        conn.close()
         return {'variants': variants, 'traits': traits, 'genes': genes}
     except sqlite3.Error:
         return {'variants': 0, 'traits': 0, 'genes': 0}
+    finally:
+        conn.close()
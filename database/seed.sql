@@ -0,0 +1,318 @@
+-- Generated by database/seed_data.py; do not edit by hand.
+INSERT OR IGNORE INTO variants (variant_id, chromosome, position, ref_allele, alt_allele, mapped_gene) VALUES
+('rs6983267', '8', 128413305, 'A', 'G', 'MYC'),
+('rs1042522', '17', 7579472, 'C', 'G', 'TP53'),
+('rs2981582', '10', 123337335, 'A', 'G', 'FGFR2'),
+('rs889312', '5', 56031884, 'A', 'C', 'MAP3K1'),
+('rs13281615', '8', 128355618, 'A', 'G', 'MYC'),
+('rs4430796', '17', 36098040, 'A', 'G', 'HNF1B'),
+('rs1447295', '8', 128554220, 'A', 'C', 'CASC8'),
+('rs10993994', '10', 51549496, 'C', 'T', 'MSMB'),
+('rs6504950', '17', 53056471, 'A', 'G', 'STXBP4'),
+('rs614367', '11', 69328764, 'C', 'T', 'CCND1'),
+('rs1333049', '9', 22125500, 'C', 'G', 'CDKN2A'),
+('rs10757278', '9', 22124478, 'A', 'G', 'CDKN2A'),
+('rs1801133', '1', 11856378, 'C', 'T', 'MTHFR'),
+('rs662799', '11', 116663707, 'A', 'G', 'APOA5'),
+('rs964184', '11', 116648917, 'C', 'G', 'ZNF259'),
+('rs12740374', '1', 109821511, 'G', 'T', 'CELSR2'),
+('rs6511720', '19', 11202306, 'G', 'T', 'LDLR'),
+('rs1800961', '20', 43042364, 'C', 'T', 'HNF4A'),
+('rs4420638', '19', 45422946, 'A', 'G', 'APOE'),
+('rs1799983', '7', 150999023, 'G', 'T', 'NOS3'),
+('rs5186', '3', 148459988, 'A', 'C', 'AGTR1'),
+('rs17465637', '1', 56962821, 'A', 'C', 'MIA3'),
+('rs7903146', '10', 114758349, 'C', 'T', 'TCF7L2'),
+('rs1801282', '3', 12393125, 'C', 'G', 'PPARG'),
+('rs5219', '11', 17409572, 'C', 'T', 'KCNJ11'),
+('rs13266634', '8', 118184783, 'C', 'T', 'SLC30A8'),
+('rs10811661', '9', 22134095, 'C', 'T', 'CDKN2A'),
+('rs7756992', '6', 20679709, 'A', 'G', 'CDKAL1'),
+('rs9939609', '16', 53820527, 'A', 'T', 'FTO'),
+('rs17782313', '18', 57851097, 'C', 'T', 'MC4R'),
+('rs1558902', '16', 53803574, 'A', 'T', 'FTO'),
+('rs2943641', '2', 227093745, 'C', 'T', 'IRS1'),
+('rs780094', '2', 27741237, 'C', 'T', 'GCKR'),
+('rs560887', '2', 169763148, 'C', 'T', 'G6PC2'),
+('rs174547', '11', 61570783, 'C', 'T', 'FADS1'),
+('rs328', '8', 19819724, 'C', 'G', 'LPL'),
+('rs1260326', '2', 27730940, 'C', 'T', 'GCKR'),
+('rs429358', '19', 45411941, 'C', 'T', 'APOE'),
+('rs7412', '19', 45412079, 'C', 'T', 'APOE'),
+('rs1006737', '3', 53127857, 'A', 'G', 'CACNA1C'),
+('rs2251219', '16', 9975495, 'C', 'T', 'GRIN2A'),
+('rs6265', '11', 27679916, 'C', 'T', 'BDNF'),
+('rs1800497', '11', 113400106, 'C', 'T', 'DRD2'),
+('rs4680', '22', 19963748, 'A', 'G', 'COMT'),
+('rs1344706', '2', 185778428, 'A', 'C', 'ZNF804A'),
+('rs12807809', '11', 113412746, 'C', 'T', 'NCAM1'),
+('rs16969968', '15', 78882925, 'A', 'G', 'CHRNA5'),
+('rs6313', '13', 47471478, 'C', 'T', 'HTR2A'),
+('rs10494561', '1', 78433414, 'A', 'G', 'PTBP2'),
+('rs12124819', '1', 713790, 'A', 'G', 'LINC01128'),
+('rs12913832', '15', 28365618, 'A', 'G', 'HERC2'),
+('rs1667394', '15', 28530182, 'A', 'G', 'OCA2'),
+('rs1426654', '15', 48426484, 'A', 'G', 'SLC24A5'),
+('rs16891982', '5', 33951693, 'C', 'G', 'SLC45A2'),
+('rs1805007', '16', 89986117, 'C', 'T', 'MC1R'),
+('rs1805008', '16', 89986144, 'C', 'T', 'MC1R'),
+('rs143384', '20', 34025756, 'A', 'G', 'GDF5'),
+('rs1042725', '12', 66339827, 'C', 'T', 'HMGA2'),
+('rs6060369', '20', 6604619, 'C', 'T', 'BMP2'),
+('rs2284746', '2', 55308273, 'C', 'G', 'EFEMP1'),
+('rs6060373', '20', 6608684, 'G', 'T', 'BMP2'),
+('rs1799971', '6', 154039662, 'A', 'G', 'OPRM1'),
+('rs4988235', '2', 136608646, 'C', 'T', 'MCM6'),
+('rs713598', '7', 141972604, 'C', 'G', 'TAS2R38'),
+('rs3087243', '2', 204738919, 'A', 'G', 'CTLA4'),
+('rs2476601', '1', 114377568, 'A', 'G', 'PTPN22'),
+('rs6897932', '5', 35910332, 'C', 'T', 'IL7R'),
+('rs3135388', '6', 32681631, 'A', 'G', 'HLA-DRA'),
+('rs11209026', '1', 67705958, 'A', 'G', 'IL23R'),
+('rs2201841', '1', 67649663, 'C', 'T', 'IL23R'),
+('rs17234657', '5', 40437946, 'G', 'T', 'PTGER4'),
+('rs11465804', '1', 67703015, 'G', 'T', 'IL23R'),
+('rs2066847', '16', 50745926, 'C', 'T', 'NOD2'),
+('rs10781499', '9', 117552851, 'A', 'G', 'CARD9'),
+('rs2395029', '6', 31431780, 'G', 'T', 'HLA-B'),
+('rs334', '11', 5227002, 'A', 'T', 'HBB'),
+('rs5030737', '10', 54531242, 'A', 'G', 'CYP2R1'),
+('rs12785878', '11', 71167449, 'G', 'T', 'NADSYN1'),
+('rs2282679', '4', 72608383, 'A', 'C', 'GC'),
+('rs12203592', '6', 396321, 'C', 'T', 'IRF4'),
+('rs1800562', '6', 26093141, 'A', 'G', 'HFE'),
+('rs855791', '22', 37462936, 'A', 'G', 'TMPRSS6'),
+('rs4820268', '22', 37470224, 'A', 'G', 'TMPRSS6'),
+('rs1805087', '1', 237048500, 'A', 'G', 'MTR'),
+('rs12272669', '11', 5248232, 'A', 'G', 'HBG2'),
+('rs2228570', '12', 48272895, 'C', 'T', 'VDR'),
+('rs1801131', '1', 11854476, 'A', 'C', 'MTHFR'),
+('rs4654748', '1', 23754255, 'C', 'T', 'NBPF3'),
+('rs602662', '19', 49206674, 'A', 'G', 'FUT2'),
+('rs3760775', '15', 78806023, 'A', 'G', 'CHRNA3'),
+('rs2187668', '6', 32610875, 'C', 'T', 'HLA-DQA1'),
+('rs6822844', '4', 123377980, 'G', 'T', 'IL2'),
+('rs4148323', '2', 234668879, 'A', 'G', 'UGT1A1'),
+('rs6025', '1', 169549811, 'C', 'T', 'F5'),
+('rs1799963', '11', 46739505, 'A', 'G', 'F2'),
+('rs4149056', '12', 21331549, 'C', 'T', 'SLCO1B1'),
+('rs1057910', '10', 96702047, 'A', 'C', 'CYP2C9'),
+('rs9923231', '16', 31107689, 'C', 'T', 'VKORC1'),
+('rs12979860', '19', 39738787, 'C', 'T', 'IFNL3'),
+('rs8099917', '19', 39733758, 'G', 'T', 'IFNL3'),
+('rs3131972', '1', 694713, 'A', 'G', 'SAMD11'),
+('rs11240777', '1', 856331, 'A', 'G', 'KLHL17'),
+('rs4970383', '1', 1019440, 'A', 'G', 'ISG15'),
+('rs6681049', '1', 909917, 'C', 'T', 'PLEKHN1');
+INSERT OR IGNORE INTO variant_trait_assoc (variant_id, reported_trait, p_value, odds_ratio, risk_allele, sample_size, category, pubmed_id) VALUES
+('rs6983267', 'Colorectal cancer', 5.2e-11, 1.27, 'G', 201518, 'Oncology', '17618284'),
+('rs1042522', 'Lung cancer', 3.1e-08, 1.18, 'C', 15000, 'Oncology', '19336370'),
+('rs2981582', 'Breast cancer', 2e-76, 1.26, 'A', 96000, 'Oncology', '17529967'),
+('rs889312', 'Breast cancer', 6.5e-20, 1.13, 'C', 96000, 'Oncology', '17529967'),
+('rs13281615', 'Breast cancer', 5.1e-09, 1.08, 'G', 96000, 'Oncology', '17529967'),
+('rs4430796', 'Prostate cancer', 1.4e-10, 1.22, 'A', 50000, 'Oncology', '17603485'),
+('rs1447295', 'Prostate cancer', 7.7e-14, 1.72, 'A', 50000, 'Oncology', '17401363'),
+('rs10993994', 'Prostate cancer', 7.8e-31, 1.25, 'T', 50000, 'Oncology', '18264097'),
+('rs6504950', 'Breast cancer', 4.1e-08, 1.05, 'G', 96000, 'Oncology', '20453838'),
+('rs614367', 'Breast cancer', 1.4e-13, 1.15, 'T', 96000, 'Oncology', '20453838'),
+('rs1333049', 'Coronary artery disease', 4.8e-14, 1.36, 'C', 256000, 'Cardiovascular', '17554300'),
+('rs10757278', 'Myocardial infarction', 1.2e-20, 1.28, 'G', 50000, 'Cardiovascular', '17478679'),
+('rs1801133', 'Homocysteine levels', 2.3e-15, 1.15, 'T', 30000, 'Cardiovascular', '18439552'),
+('rs662799', 'Triglycerides', 1e-50, 1.25, 'A', 100000, 'Cardiovascular', '18193043'),
+('rs964184', 'LDL cholesterol', 3.4e-40, 1.15, 'G', 100000, 'Cardiovascular', '20686565'),
+('rs12740374', 'LDL cholesterol', 1e-170, 1.2, 'T', 100000, 'Cardiovascular', '20686565'),
+('rs6511720', 'LDL cholesterol', 5e-117, 1.25, 'T', 100000, 'Cardiovascular', '20686565'),
+('rs1800961', 'HDL cholesterol', 1e-14, 1.1, 'T', 100000, 'Cardiovascular', '18193044'),
+('rs4420638', 'Total cholesterol', 1e-300, 1.3, 'G', 100000, 'Cardiovascular', '18193043'),
+('rs1799983', 'Hypertension', 2.5e-08, 1.12, 'T', 50000, 'Cardiovascular', '19430483'),
+('rs5186', 'Hypertension', 1.8e-09, 1.15, 'C', 50000, 'Cardiovascular', '20522523'),
+('rs17465637', 'Coronary artery disease', 1.2e-09, 1.14, 'C', 100000, 'Cardiovascular', '17634449'),
+('rs7903146', 'Type 2 diabetes', 2.3e-36, 1.37, 'T', 120000, 'Metabolic', '17293876'),
+('rs7903146', 'Fasting glucose', 1.1e-20, 1.25, 'T', 80000, 'Metabolic', '20081858'),
+('rs7903146', 'Insulin resistance', 5.5e-15, 1.2, 'T', 60000, 'Metabolic', '22158537'),
+('rs1801282', 'Type 2 diabetes', 1.7e-06, 1.14, 'C', 80000, 'Metabolic', '18372903'),
+('rs5219', 'Type 2 diabetes', 5e-11, 1.14, 'T', 80000, 'Metabolic', '18372903'),
+('rs13266634', 'Type 2 diabetes', 5.3e-08, 1.12, 'T', 80000, 'Metabolic', '17460697'),
+('rs10811661', 'Type 2 diabetes', 7.8e-15, 1.2, 'T', 80000, 'Metabolic', '17463246'),
+('rs7756992', 'Type 2 diabetes', 4.1e-11, 1.12, 'G', 80000, 'Metabolic', '17463249'),
+('rs9939609', 'Obesity', 1e-42, 1.31, 'A', 200000, 'Metabolic', '17434869'),
+('rs17782313', 'BMI', 2e-15, 1.12, 'C', 200000, 'Metabolic', '18454148'),
+('rs1558902', 'BMI', 4.8e-120, 1.39, 'A', 339000, 'Metabolic', '25673413'),
+('rs2943641', 'Insulin resistance', 5.4e-20, 1.19, 'C', 50000, 'Metabolic', '22158537'),
+('rs780094', 'Fasting glucose', 1e-30, 1.1, 'T', 80000, 'Metabolic', '20081858'),
+('rs560887', 'Fasting glucose', 1e-75, 1.2, 'C', 80000, 'Metabolic', '20081858'),
+('rs174547', 'Triglycerides', 4.5e-24, 1.08, 'T', 100000, 'Metabolic', '20686565'),
+('rs328', 'Triglycerides', 1e-27, 1.15, 'G', 100000, 'Metabolic', '18193043'),
+('rs1260326', 'Triglycerides', 8e-133, 1.15, 'T', 100000, 'Metabolic', '20686565'),
+('rs429358', 'Alzheimer disease', 1e-200, 3.68, 'C', 50000, 'Metabolic', '19734902'),
+('rs7412', 'LDL cholesterol', 1e-150, 1.4, 'T', 100000, 'Metabolic', '20686565'),
+('rs1006737', 'Bipolar disorder', 7e-08, 1.18, 'A', 50000, 'Neuropsychiatric', '18711365'),
+('rs2251219', 'Major depression', 6e-08, 1.12, 'T', 50000, 'Neuropsychiatric', '21926974'),
+('rs6265', 'Depression', 3e-06, 1.1, 'T', 40000, 'Neuropsychiatric', '21112890'),
+('rs1800497', 'Alcohol dependence', 2.5e-07, 1.25, 'T', 30000, 'Neuropsychiatric', '18227835'),
+('rs4680', 'Schizophrenia', 4e-06, 1.08, 'G', 40000, 'Neuropsychiatric', '21926972'),
+('rs1344706', 'Schizophrenia', 1.6e-07, 1.1, 'C', 40000, 'Neuropsychiatric', '18711365'),
+('rs12807809', 'Nicotine dependence', 1.3e-08, 1.15, 'T', 50000, 'Neuropsychiatric', '20418890'),
+('rs16969968', 'Nicotine dependence', 5e-19, 1.32, 'A', 50000, 'Neuropsychiatric', '18385739'),
+('rs6313', 'Depression response', 1e-05, 1.15, 'T', 20000, 'Neuropsychiatric', '18073774'),
+('rs10494561', 'Anxiety disorders', 3.2e-06, 1.12, 'G', 30000, 'Neuropsychiatric', '26754954'),
+('rs12124819', 'Cognitive function', 2.1e-08, 1.05, 'G', 100000, 'Neuropsychiatric', '25869804'),
+('rs12913832', 'Eye color', 1e-300, 25.0, 'G', 10000, 'Physical Trait', '18252222'),
+('rs1667394', 'Eye color', 3.5e-40, 5.0, 'A', 10000, 'Physical Trait', '18252222'),
+('rs1426654', 'Skin pigmentation', 1e-200, 10.0, 'A', 5000, 'Physical Trait', '16357253'),
+('rs16891982', 'Skin pigmentation', 5e-90, 8.0, 'C', 5000, 'Physical Trait', '17999355'),
+('rs1805007', 'Red hair', 1e-150, 20.0, 'T', 10000, 'Physical Trait', '11692016'),
+('rs1805008', 'Red hair', 2e-80, 12.0, 'T', 10000, 'Physical Trait', '11692016'),
+('rs143384', 'Height', 5e-30, 1.08, 'A', 250000, 'Physical Trait', '20881960'),
+('rs1042725', 'Height', 4.2e-16, 1.05, 'T', 250000, 'Physical Trait', '18391950'),
+('rs6060369', 'Height', 7.5e-11, 1.04, 'T', 250000, 'Physical Trait', '20881960'),
+('rs2284746', 'Height', 1e-21, 1.06, 'G', 250000, 'Physical Trait', '20881960'),
+('rs6060373', 'Height', 2.3e-12, 1.04, 'T', 250000, 'Physical Trait', '20881960'),
+('rs1799971', 'Pain sensitivity', 1.5e-06, 1.2, 'G', 10000, 'Physical Trait', '15057820'),
+('rs4988235', 'Lactose intolerance', 1e-100, 15.0, 'T', 50000, 'Physical Trait', '12594458'),
+('rs713598', 'Bitter taste perception', 1e-50, 5.0, 'C', 5000, 'Physical Trait', '12595690'),
+('rs3087243', 'Rheumatoid arthritis', 1e-08, 1.12, 'G', 30000, 'Immune', '17804836'),
+('rs2476601', 'Rheumatoid arthritis', 9e-25, 1.75, 'A', 30000, 'Immune', '15208781'),
+('rs6897932', 'Multiple sclerosis', 2.9e-07, 1.18, 'C', 20000, 'Immune', '17660530'),
+('rs3135388', 'Multiple sclerosis', 1e-60, 2.5, 'A', 20000, 'Immune', '17660530'),
+('rs11209026', 'Psoriasis', 4e-15, 1.4, 'A', 25000, 'Immune', '17554261'),
+('rs2201841', 'Crohn disease', 2e-12, 1.3, 'T', 25000, 'Immune', '17435756'),
+('rs17234657', 'Crohn disease', 1e-10, 1.25, 'T', 25000, 'Immune', '17435756'),
+('rs11465804', 'Ulcerative colitis', 3e-09, 1.35, 'T', 25000, 'Immune', '18587394'),
+('rs2066847', 'Crohn disease', 1e-40, 2.5, 'T', 25000, 'Immune', '11385576'),
+('rs10781499', 'Inflammatory bowel disease', 8e-12, 1.2, 'A', 25000, 'Immune', '17435756'),
+('rs2395029', 'HIV progression', 5e-16, 2.1, 'G', 10000, 'Infectious', '17767157'),
+('rs334', 'Malaria resistance', 1e-100, 10.0, 'T', 5000, 'Infectious', '12364793'),
+('rs5030737', 'Vitamin D deficiency', 1.5e-10, 1.15, 'A', 30000, 'Other', '20541252'),
+('rs12785878', 'Vitamin D levels', 3e-12, 1.12, 'T', 30000, 'Other', '20541252'),
+('rs2282679', 'Vitamin D levels', 1e-50, 1.3, 'C', 30000, 'Other', '20541252'),
+('rs12203592', 'Freckling', 1e-80, 3.0, 'T', 10000, 'Other', '18488028'),
+('rs1800562', 'Hemochromatosis', 1e-100, 8.0, 'A', 20000, 'Other', '8696333'),
+('rs855791', 'Iron levels', 1e-40, 1.25, 'A', 50000, 'Other', '19553259'),
+('rs4820268', 'Hemoglobin levels', 5e-35, 1.2, 'G', 50000, 'Other', '19553259'),
+('rs1805087', 'Folate levels', 2e-10, 1.15, 'G', 30000, 'Other', '18463370'),
+('rs12272669', 'Fetal hemoglobin', 1e-45, 1.5, 'A', 10000, 'Other', '17903302'),
+('rs2228570', 'Bone mineral density', 3.5e-07, 1.1, 'T', 30000, 'Other', '19079261'),
+('rs1801131', 'Folate metabolism', 1e-08, 1.08, 'C', 30000, 'Other', '18439552'),
+('rs4654748', 'Vitamin B6 levels', 2e-12, 1.12, 'T', 20000, 'Other', '21878437'),
+('rs602662', 'Vitamin B12 levels', 1e-25, 1.2, 'G', 30000, 'Other', '21878437'),
+('rs3760775', 'Aging', 4e-08, 1.08, 'A', 50000, 'Other', '25740864'),
+('rs2187668', 'Celiac disease', 1e-200, 6.0, 'T', 30000, 'Other', '18311140'),
+('rs6822844', 'Celiac disease', 1e-12, 1.3, 'T', 30000, 'Other', '18311140'),
+('rs4148323', 'Bilirubin levels', 1e-300, 2.5, 'A', 50000, 'Metabolic', '18179887'),
+('rs6025', 'Venous thrombosis', 1e-50, 5.0, 'T', 30000, 'Cardiovascular', '7989264'),
+('rs1799963', 'Venous thrombosis', 1e-20, 2.8, 'A', 30000, 'Cardiovascular', '8619974'),
+('rs4149056', 'Statin response', 5e-20, 4.5, 'C', 10000, 'Other', '18650507'),
+('rs1057910', 'Warfarin dose', 1e-30, 1.8, 'C', 10000, 'Other', '15930419'),
+('rs9923231', 'Warfarin dose', 1e-100, 2.5, 'T', 10000, 'Other', '15930419'),
+('rs12979860', 'Hepatitis C response', 1e-30, 2.0, 'C', 10000, 'Infectious', '20639878'),
+('rs8099917', 'Hepatitis C response', 5e-25, 1.8, 'T', 10000, 'Infectious', '19749758'),
+('rs3131972', 'Immune function', 2e-06, 1.05, 'G', 50000, 'Immune', '21833088'),
+('rs11240777', 'Gene expression', 1.5e-05, 1.03, 'G', 40000, 'Other', '22446963'),
+('rs4970383', 'Blood pressure', 3e-06, 1.06, 'G', 80000, 'Cardiovascular', '21909115'),
+('rs6681049', 'Lipid levels', 2.5e-05, 1.04, 'T', 60000, 'Metabolic', '20686565');
+INSERT OR IGNORE INTO allele_frequencies (variant_id, af_overall, af_eur, af_afr, af_eas, af_amr) VALUES
+('rs6983267', 0.48, 0.5, 0.42, 0.38, 0.45),
+('rs1042522', 0.72, 0.7, 0.55, 0.6, 0.65),
+('rs2981582', 0.38, 0.4, 0.35, 0.3, 0.35),
+('rs889312', 0.28, 0.3, 0.25, 0.2, 0.27),
+('rs13281615', 0.4, 0.42, 0.38, 0.35, 0.4),
+('rs4430796', 0.48, 0.5, 0.45, 0.42, 0.48),
+('rs1447295', 0.11, 0.12, 0.1, 0.08, 0.1),
+('rs10993994', 0.41, 0.45, 0.3, 0.35, 0.4),
+('rs6504950', 0.27, 0.28, 0.25, 0.22, 0.26),
+('rs614367', 0.16, 0.18, 0.12, 0.1, 0.14),
+('rs1333049', 0.47, 0.5, 0.4, 0.35, 0.45),
+('rs10757278', 0.48, 0.5, 0.42, 0.38, 0.46),
+('rs1801133', 0.35, 0.38, 0.12, 0.3, 0.45),
+('rs662799', 0.15, 0.08, 0.35, 0.3, 0.12),
+('rs964184', 0.18, 0.15, 0.4, 0.35, 0.2),
+('rs12740374', 0.22, 0.25, 0.08, 0.15, 0.2),
+('rs6511720', 0.12, 0.15, 0.02, 0.08, 0.1),
+('rs1800961', 0.05, 0.04, 0.02, 0.08, 0.03),
+('rs4420638', 0.17, 0.2, 0.05, 0.08, 0.15),
+('rs1799983', 0.33, 0.35, 0.25, 0.15, 0.3),
+('rs5186', 0.28, 0.3, 0.05, 0.08, 0.22),
+('rs17465637', 0.72, 0.75, 0.55, 0.6, 0.7),
+('rs7903146', 0.3, 0.35, 0.28, 0.05, 0.25),
+('rs1801282', 0.12, 0.15, 0.02, 0.04, 0.1),
+('rs5219', 0.35, 0.38, 0.42, 0.45, 0.4),
+('rs13266634', 0.7, 0.75, 0.4, 0.6, 0.65),
+('rs10811661', 0.79, 0.82, 0.9, 0.55, 0.75),
+('rs7756992', 0.31, 0.35, 0.42, 0.5, 0.38),
+('rs9939609', 0.42, 0.45, 0.12, 0.15, 0.35),
+('rs17782313', 0.24, 0.28, 0.18, 0.2, 0.22),
+('rs1558902', 0.41, 0.45, 0.12, 0.15, 0.35),
+('rs2943641', 0.63, 0.65, 0.7, 0.85, 0.68),
+('rs780094', 0.39, 0.42, 0.55, 0.48, 0.45),
+('rs560887', 0.3, 0.35, 0.08, 0.2, 0.28),
+('rs174547', 0.33, 0.35, 0.55, 0.65, 0.4),
+('rs328', 0.09, 0.1, 0.02, 0.05, 0.08),
+('rs1260326', 0.4, 0.45, 0.48, 0.55, 0.42),
+('rs429358', 0.14, 0.15, 0.22, 0.08, 0.1),
+('rs7412', 0.08, 0.08, 0.1, 0.12, 0.05),
+('rs1006737', 0.33, 0.35, 0.28, 0.3, 0.32),
+('rs2251219', 0.38, 0.4, 0.35, 0.32, 0.36),
+('rs6265', 0.2, 0.18, 0.45, 0.5, 0.25),
+('rs1800497', 0.19, 0.18, 0.5, 0.35, 0.22),
+('rs4680', 0.48, 0.5, 0.28, 0.35, 0.45),
+('rs1344706', 0.32, 0.35, 0.45, 0.4, 0.38),
+('rs12807809', 0.4, 0.42, 0.35, 0.3, 0.38),
+('rs16969968', 0.35, 0.38, 0.05, 0.03, 0.15),
+('rs6313', 0.43, 0.45, 0.52, 0.48, 0.4),
+('rs10494561', 0.28, 0.3, 0.22, 0.18, 0.25),
+('rs12124819', 0.25, 0.28, 0.15, 0.2, 0.22),
+('rs12913832', 0.78, 0.8, 0.02, 0.05, 0.45),
+('rs1667394', 0.7, 0.75, 0.02, 0.03, 0.35),
+('rs1426654', 0.99, 0.99, 0.03, 0.05, 0.55),
+('rs16891982', 0.95, 0.98, 0.02, 0.05, 0.45),
+('rs1805007', 0.08, 0.1, 0.0, 0.0, 0.03),
+('rs1805008', 0.05, 0.06, 0.0, 0.0, 0.02),
+('rs143384', 0.58, 0.6, 0.48, 0.45, 0.55),
+('rs1042725', 0.49, 0.52, 0.38, 0.42, 0.48),
+('rs6060369', 0.35, 0.38, 0.28, 0.25, 0.32),
+('rs2284746', 0.6, 0.62, 0.7, 0.75, 0.58),
+('rs6060373', 0.33, 0.35, 0.25, 0.22, 0.3),
+('rs1799971', 0.15, 0.12, 0.02, 0.4, 0.18),
+('rs4988235', 0.5, 0.75, 0.15, 0.02, 0.35),
+('rs713598', 0.45, 0.48, 0.35, 0.3, 0.42),
+('rs3087243', 0.42, 0.45, 0.68, 0.55, 0.48),
+('rs2476601', 0.09, 0.1, 0.01, 0.0, 0.03),
+('rs6897932', 0.23, 0.25, 0.15, 0.12, 0.2),
+('rs3135388', 0.13, 0.15, 0.05, 0.02, 0.08),
+('rs11209026', 0.07, 0.08, 0.01, 0.0, 0.03),
+('rs2201841', 0.08, 0.09, 0.02, 0.01, 0.04),
+('rs17234657', 0.15, 0.18, 0.05, 0.03, 0.1),
+('rs11465804', 0.07, 0.08, 0.01, 0.0, 0.03),
+('rs2066847', 0.04, 0.05, 0.0, 0.0, 0.01),
+('rs10781499', 0.1, 0.12, 0.25, 0.3, 0.15),
+('rs2395029', 0.05, 0.06, 0.02, 0.01, 0.03),
+('rs334', 0.02, 0.0, 0.1, 0.0, 0.02),
+('rs5030737', 0.08, 0.1, 0.02, 0.03, 0.05),
+('rs12785878', 0.35, 0.38, 0.28, 0.25, 0.32),
+('rs2282679', 0.27, 0.3, 0.08, 0.15, 0.22),
+('rs12203592', 0.16, 0.18, 0.01, 0.0, 0.08),
+('rs1800562', 0.06, 0.08, 0.0, 0.0, 0.02),
+('rs855791', 0.45, 0.48, 0.52, 0.68, 0.5),
+('rs4820268', 0.42, 0.45, 0.48, 0.65, 0.48),
+('rs1805087', 0.2, 0.22, 0.12, 0.1, 0.18),
+('rs12272669', 0.15, 0.08, 0.3, 0.25, 0.12),
+('rs2228570', 0.35, 0.38, 0.52, 0.45, 0.4),
+('rs1801131', 0.32, 0.35, 0.12, 0.25, 0.4),
+('rs4654748', 0.45, 0.48, 0.38, 0.35, 0.42),
+('rs602662', 0.45, 0.48, 0.42, 0.38, 0.4),
+('rs3760775', 0.38, 0.4, 0.08, 0.05, 0.15),
+('rs2187668', 0.15, 0.18, 0.02, 0.01, 0.08),
+('rs6822844', 0.12, 0.15, 0.02, 0.03, 0.08),
+('rs4148323', 0.1, 0.02, 0.3, 0.08, 0.05),
+('rs6025', 0.03, 0.04, 0.01, 0.0, 0.02),
+('rs1799963', 0.01, 0.02, 0.0, 0.0, 0.01),
+('rs4149056', 0.15, 0.18, 0.12, 0.02, 0.1),
+('rs1057910', 0.07, 0.08, 0.02, 0.04, 0.05),
+('rs9923231', 0.38, 0.42, 0.08, 0.92, 0.35),
+('rs12979860', 0.67, 0.75, 0.38, 0.95, 0.6),
+('rs8099917', 0.2, 0.25, 0.1, 0.05, 0.15),
+('rs3131972', 0.17, 0.2, 0.05, 0.08, 0.12),
+('rs11240777', 0.3, 0.35, 0.22, 0.18, 0.28),
+('rs4970383', 0.35, 0.38, 0.28, 0.25, 0.32),
+('rs6681049', 0.4, 0.42, 0.48, 0.52, 0.45);
@@ -20,20 +20,39 @@ Usage:
 
 import os
 import sys
+import csv
 import json
 import gzip
 import sqlite3
 import time
 import argparse
 import hashlib
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Set
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, List, Tuple, Set, Iterable, Iterator
 from pathlib import Path
-from io import BytesIO
+from io import TextIOWrapper
 
+import numpy as np
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    from isal import igzip
+except ImportError:  # optional, falls back to the stdlib gzip module
+    igzip = None
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 DB_DIR = SCRIPT_DIR
@@ -50,54 +69,284 @@ PGS_API_BASE = "https://www.pgscatalog.org/rest"
 MAX_VARIANTS_PER_SCORE = 100_000
 REQUEST_TIMEOUT = 60
 REQUEST_DELAY = 0.5  # Be nice to the API
+DOWNLOAD_WORKERS = 16  # Concurrent scoring file downloads (hides per-request latency)
+DOWNLOAD_QUEUE_SIZE = 8  # Parsed scoring files allowed to wait for the writer
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Redraw progress bars at most every 0.5s so hot loops skip tqdm bookkeeping
+PROGRESS_OPTIONS = {'mininterval': 0.5, 'maxinterval': 2.0, 'smoothing': 0.1}
+POSTFIX_INTERVAL = 1.0  # Seconds between ETA postfix rebuilds in update_pgs
+
+# Insert column order for bulk loads
+GWAS_COLUMNS = (
+    "rsid", "chromosome", "position", "effect_allele", "other_allele",
+    "p_value", "odds_ratio", "beta", "ci_lower", "ci_upper",
+    "trait", "trait_uri", "study_accession", "pubmed_id", "first_author",
+    "publication_date", "journal", "sample_size", "ancestry", "risk_frequency"
+)
+PGS_VARIANT_COLUMNS = (
+    "pgs_id", "rsid", "chromosome", "position",
+    "effect_allele", "other_allele", "effect_weight", "allele_frequency"
+)
+
+# Header names recognised for each field, in order of preference
+GWAS_COLUMN_ALIASES = {
+    'rsid': ('SNPS', 'SNP_ID_CURRENT', 'STRONGEST SNP-RISK ALLELE'),
+    'chromosome': ('CHR_ID', 'CHROMOSOME'),
+    'position': ('CHR_POS', 'POSITION'),
+    'p_value': ('P-VALUE', 'PVALUE'),
+    'odds_ratio': ('OR OR BETA', 'ODDS RATIO', 'OR'),
+    'trait': ('DISEASE/TRAIT', 'MAPPED_TRAIT', 'TRAIT'),
+    'trait_uri': ('MAPPED_TRAIT_URI',),
+    'study_accession': ('STUDY ACCESSION', 'STUDY_ACCESSION'),
+    'pubmed_id': ('PUBMEDID', 'PUBMED_ID'),
+    'first_author': ('FIRST AUTHOR', 'FIRST_AUTHOR'),
+    'sample_size': ('INITIAL SAMPLE SIZE', 'SAMPLE_SIZE'),
+    'risk_frequency': ('RISK ALLELE FREQUENCY', 'RAF'),
+}
+PGS_COLUMN_ALIASES = {
+    'rsid': ('rsid', 'snp', 'snp_id'),
+    'chromosome': ('chr_name', 'chromosome', 'chr'),
+    'position': ('chr_position', 'position', 'pos', 'bp'),
+    'effect_allele': ('effect_allele', 'a1', 'allele1', 'ea'),
+    'other_allele': ('other_allele', 'a2', 'allele2', 'oa', 'reference_allele'),
+    'weight': ('effect_weight', 'weight', 'beta'),
+    'frequency': ('allelefrequency_effect', 'eaf', 'effect_allele_frequency'),
+}
+
+# Prepared statements kept per connection; bulk loads reuse identical SQL text
+STATEMENT_CACHE_SIZE = 256
+SQLITE_MAX_VARIABLES = 32766  # SQLite's default bound-parameter limit since 3.32
+PAGE_SIZE = 8192
+
+# Bounds for preallocate_database(). SQLite rejects blobs over 1,000,000,000
+# bytes by default, and the preallocated space is never given back
+PREALLOCATE_MAX_BYTES = 256 * 1024 * 1024
+PREALLOCATE_BLOB_BYTES = 64 * 1024 * 1024
+
+# Connection settings for bulk loads. Durability is traded for speed: a
+# crash mid-load only loses data that can be downloaded again.
+BULK_LOAD_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-262144;
+    PRAGMA locking_mode=EXCLUSIVE;
+    PRAGMA mmap_size=268435456;
+"""
+PGS_COMMIT_INTERVAL = 50  # Scores per transaction during the PGS import
+
+# GWAS rows parsed per chunk before each flush to batch_insert(); the flush
+# itself still binds at most `chunk` rows per statement
+INSERT_BATCH_SIZE = 20_000
+
+# Secondary indexes built once after a bulk load rather than maintained per row
+GWAS_INDEXES = {
+    "idx_gwas_rsid": "gwas_associations(rsid)",
+    "idx_gwas_trait": "gwas_associations(trait)",
+    "idx_gwas_chr_pos": "gwas_associations(chromosome, position)",
+}
+PGS_INDEXES = {
+    "idx_pgs_variants_rsid": "pgs_variants(rsid)",
+}
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that keeps connections alive between requests."""
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    # One pooled connection per download worker so none are discarded
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DOWNLOAD_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared session so repeated API/FTP calls reuse the same TCP+TLS connection
+SESSION = _create_session()
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter spacing calls evenly at a fixed rate.
+    
+    Each acquire() reserves the next free slot and sleeps until it arrives,
+    so concurrent workers share one request budget.
+    """
+    
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# State keys holding PGS IDs; kept as sets in memory, sorted lists on disk
+_SCORE_ID_KEYS = ("processed_scores", "failed_scores")
 
 
 def load_state() -> Dict:
     """Load update state from file."""
+    state = None
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
+            if orjson is not None:
+                with open(STATE_FILE, 'rb') as f:
+                    state = orjson.loads(f.read())
+            else:
+                with open(STATE_FILE, 'r') as f:
+                    state = json.load(f)
         except (json.JSONDecodeError, IOError):
             pass
-    return {
-        "gwas": {"last_update": None, "status": "never"},
-        "pgs": {
-            "last_update": None, 
-            "status": "never",
-            "processed_scores": [],
-            "failed_scores": [],
-            "total_scores": 0,
-            "total_variants": 0
+    if state is None:
+        state = {
+            "gwas": {"last_update": None, "status": "never"},
+            "pgs": {
+                "last_update": None, 
+                "status": "never",
+                "processed_scores": [],
+                "failed_scores": [],
+                "total_scores": 0,
+                "total_variants": 0
+            }
         }
-    }
+    
+    pgs_state = state.setdefault("pgs", {})
+    for key in _SCORE_ID_KEYS:
+        pgs_state[key] = set(pgs_state.get(key, []))
+    return state
 
 
 def save_state(state: Dict) -> None:
     """Save update state to file."""
+    pgs_state = state.get("pgs", {})
+    serializable = {**state, "pgs": {
+        **pgs_state,
+        **{key: sorted(pgs_state.get(key, ())) for key in _SCORE_ID_KEYS}
+    }}
+    
+    if orjson is not None:
+        with open(STATE_FILE, 'wb') as f:
+            f.write(orjson.dumps(serializable, default=str, option=orjson.OPT_INDENT_2))
+        return
     with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2, default=str)
+        json.dump(serializable, f, indent=2, default=str)
 
 
 def format_time(seconds: float) -> str:
     """Format seconds as human-readable time."""
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        return f"{int(seconds // 60)}m {int(seconds % 60)}s"
-    else:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s" if minutes else f"{secs}s"
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(bytes_size: int) -> str:
     """Format bytes as human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024
-    return f"{bytes_size:.1f} TB"
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    bytes_size = int(bytes_size)
+    i = min(max(bytes_size.bit_length() - 1, 0), 49) // 10
+    return f"{bytes_size / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+
+def batch_insert(cursor: sqlite3.Cursor, table: str, cols: Tuple[str, ...],
+                 rows: Iterable[tuple], chunk: int = 500) -> None:
+    """
+    Insert rows using multi-row VALUES statements.
+    
+    Binds `chunk` rows per statement, amortizing the per-statement
+    step/reset cost that executemany pays for every row; the remainder is
+    inserted with executemany. The chunk is capped so a statement never
+    binds more than SQLITE_MAX_VARIABLES values. rows may be any iterable;
+    only one chunk is held in memory at a time.
+    """
+    chunk = max(1, min(chunk, SQLITE_MAX_VARIABLES // len(cols)))
+    rows = iter(rows)
+    while True:
+        vals = list(islice(rows, chunk))
+        if len(vals) < chunk:
+            break
+        cursor.execute(
+            _multi_row_insert_sql(table, cols, chunk),
+            [v for row in vals for v in row]
+        )
+    
+    # A short final chunk goes through the single-row statement so every
+    # remainder size does not prepare its own VALUES list
+    if vals:
+        cursor.executemany(_multi_row_insert_sql(table, cols, 1), vals)
+
+
+def preallocate_database(conn: sqlite3.Connection, size_bytes: int) -> None:
+    """
+    Extend the database file to roughly size_bytes before a bulk load.
+    
+    Throwaway zeroblob rows are inserted and dropped; their pages stay on
+    the freelist and are reused by the following inserts, so the file does
+    not grow page by page during the load. The growth is capped at
+    PREALLOCATE_MAX_BYTES and written in rows of PREALLOCATE_BLOB_BYTES,
+    well below SQLite's blob size limit. Freed pages are never returned to
+    the filesystem, so the file keeps this size until it is vacuumed. On a
+    WAL connection the zero pages are written twice (WAL, then checkpoint).
+    Does nothing if the file is already at least that large.
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    missing = min(size_bytes, PREALLOCATE_MAX_BYTES) - page_size * page_count
+    if missing <= 0:
+        return
+    
+    conn.execute("CREATE TABLE IF NOT EXISTS _prealloc (x BLOB)")
+    while missing > 0:
+        blob_size = min(missing, PREALLOCATE_BLOB_BYTES)
+        conn.execute("INSERT INTO _prealloc VALUES (zeroblob(?))", (blob_size,))
+        missing -= blob_size
+    conn.execute("DROP TABLE _prealloc")
+    if conn.in_transaction:
+        # Only for callers without autocommit; update_gwas' bulk connection
+        # has already committed each statement
+        conn.commit()
+
+
+def open_bulk_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a connection tuned for bulk loading.
+    
+    The connection is in autocommit mode so callers control transactions
+    with explicit BEGIN/COMMIT statements.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE)
+    conn.executescript(BULK_LOAD_PRAGMAS)
+    return conn
+
+
+def _create_indexes(conn: sqlite3.Connection, indexes: Dict[str, str]) -> None:
+    for name, target in indexes.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+def _drop_indexes(conn: sqlite3.Connection, indexes: Dict[str, str]) -> None:
+    for name in indexes:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+@lru_cache(maxsize=32)
+def _multi_row_insert_sql(table: str, cols: Tuple[str, ...], num_rows: int) -> str:
+    """Build (once) the INSERT text for a batch of num_rows rows."""
+    placeholders = "(" + ",".join("?" * len(cols)) + ")"
+    return f"INSERT INTO {table} ({', '.join(cols)}) VALUES " + ",".join([placeholders] * num_rows)
 
 
 # =============================================================================
@@ -109,6 +358,9 @@ def init_gwas_db() -> None:
     conn = sqlite3.connect(GWAS_DB)
     cursor = conn.cursor()
     
+    # Larger pages for bulk loads; only takes effect on a fresh file
+    cursor.execute(f"PRAGMA page_size={PAGE_SIZE}")
+    
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS gwas_associations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -142,15 +394,123 @@ def init_gwas_db() -> None:
         )
     """)
     
-    # Create indexes for common queries
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gwas_rsid ON gwas_associations(rsid)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gwas_trait ON gwas_associations(trait)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_gwas_chr_pos ON gwas_associations(chromosome, position)")
+    # Indexes are built by create_gwas_indexes() once the data is loaded
     
     conn.commit()
     conn.close()
 
 
+def create_gwas_indexes(conn: sqlite3.Connection) -> None:
+    """Create the GWAS lookup indexes (after the bulk insert)."""
+    _create_indexes(conn, GWAS_INDEXES)
+
+
+def _map_columns(header: List[str], aliases: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """
+    Map field names to header positions using the first alias present.
+    
+    Fields with no matching header column are left out.
+    """
+    positions = {name: i for i, name in enumerate(header)}
+    col_map = {}
+    for field, names in aliases.items():
+        for name in names:
+            if name in positions:
+                col_map[field] = positions[name]
+                break
+    return col_map
+
+
+def _nullable(values: pd.Series) -> List:
+    """Convert a Series to a list with missing values as None."""
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+_GWAS_INTEGER_COLUMNS = frozenset({'position', 'sample_size'})
+_GWAS_NUMBER_COLUMNS = frozenset({'p_value', 'odds_ratio', 'risk_frequency'})
+
+
+def gwas_insert_columns(col_indices: Dict[str, Optional[int]]) -> Tuple[str, ...]:
+    """
+    Columns of gwas_associations that the TSV actually populates.
+    
+    Columns with no source field are left to their NULL default instead of
+    binding a None for every row.
+    """
+    return tuple(col for col in GWAS_COLUMNS if col_indices.get(col) is not None)
+
+
+class _LineCountingReader:
+    """
+    Binary stream wrapper counting the lines read through it.
+    
+    The parser drops blank and malformed lines without reporting them, so
+    the skipped row count is taken from the lines actually read.
+    """
+    
+    def __init__(self, raw) -> None:
+        self._raw = raw
+        self._newlines = 0
+        self._last = b'\n'
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        if data:
+            self._newlines += data.count(b'\n')
+            self._last = data[-1:]
+        return data
+    
+    @property
+    def lines(self) -> int:
+        """Lines read so far, counting an unterminated last line."""
+        return self._newlines + (self._last != b'\n')
+
+
+def _parse_gwas_chunk(chunk: pd.DataFrame,
+                      col_indices: Dict[str, Optional[int]]) -> List[tuple]:
+    """
+    Convert a chunk of raw GWAS TSV fields into gwas_associations rows.
+    
+    Columns are looked up by position (col_indices; absent fields are missing)
+    and rows hold the columns given by gwas_insert_columns(col_indices).
+    Text fields are stripped with blanks and NR treated as missing; numeric
+    fields additionally treat NA and unparsable values as missing. Rows
+    without an rsID are dropped.
+    """
+    if col_indices.get('rsid') is None:
+        return []
+    
+    # Keep rows whose ID is an rsID, trimming "rs123-A" to "rs123"
+    rsid = chunk[col_indices['rsid']].fillna('').str.split('-', n=1).str[0]
+    keep = rsid.str.startswith('rs')
+    chunk = chunk[keep]
+    rsid = rsid[keep]
+    
+    def text(name: str) -> List:
+        values = chunk[col_indices[name]].fillna('').str.strip()
+        return _nullable(values.where(~values.isin(['', 'NR'])))
+    
+    def number(name: str) -> pd.Series:
+        values = chunk[col_indices[name]].fillna('').str.strip()
+        return pd.to_numeric(values.where(~values.isin(['', 'NR', 'NA'])), errors='coerce')
+    
+    def integer(name: str) -> List:
+        values = number(name)
+        return _nullable(np.trunc(values.where(np.isfinite(values))).astype('Int64'))
+    
+    columns = []
+    for name in gwas_insert_columns(col_indices):
+        if name == 'rsid':
+            columns.append(rsid.tolist())
+        elif name in _GWAS_INTEGER_COLUMNS:
+            columns.append(integer(name))
+        elif name in _GWAS_NUMBER_COLUMNS:
+            columns.append(_nullable(number(name)))
+        else:
+            columns.append(text(name))
+    return list(zip(*columns))
+
+
 def update_gwas(state: Dict) -> bool:
     """
     Download and update GWAS database.
@@ -170,195 +530,141 @@ def update_gwas(state: Dict) -> bool:
     
     try:
         # Stream download with progress
-        response = requests.get(GWAS_ZIP_URL, stream=True, timeout=300)
+        response = SESSION.get(GWAS_ZIP_URL, stream=True, timeout=300)
         response.raise_for_status()
         
         total_size = int(response.headers.get('content-length', 0))
         print(f"   Size: {format_size(total_size)}")
         
-        # Download with progress bar
-        data = BytesIO()
-        with tqdm(total=total_size, unit='B', unit_scale=True, desc="Downloading") as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
+        # Download to a temporary file (ZipFile needs a seekable source),
+        # hashing chunks as they arrive
+        data = tempfile.TemporaryFile()
+        digest = hashlib.sha256()
+        with tqdm(total=total_size, unit='B', unit_scale=True, unit_divisor=1024,
+                  desc="Downloading", **PROGRESS_OPTIONS) as pbar:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 data.write(chunk)
+                digest.update(chunk)
                 pbar.update(len(chunk))
         
+        checksum = digest.hexdigest()
+        print(f"   SHA-256: {checksum}")
         data.seek(0)
         
-        # Extract ZIP
-        print("\n📦 Extracting ZIP file...")
-        with zipfile.ZipFile(data, 'r') as zf:
-            # Find the TSV file
-            tsv_files = [f for f in zf.namelist() if f.endswith('.tsv')]
-            if not tsv_files:
-                print("❌ No TSV file found in ZIP")
-                return False
-            
-            tsv_file = tsv_files[0]
-            print(f"   Found: {tsv_file}")
-            
-            with zf.open(tsv_file) as f:
-                content = f.read().decode('utf-8')
+        # Open ZIP
+        print("\n📦 Opening ZIP file...")
+        zf = zipfile.ZipFile(data, 'r')
+        
+        # Find the TSV file
+        tsv_files = [f for f in zf.namelist() if f.endswith('.tsv')]
+        if not tsv_files:
+            print("❌ No TSV file found in ZIP")
+            zf.close()
+            data.close()
+            return False
         
-        lines = content.strip().split('\n')
-        print(f"\n✅ Extracted {len(lines):,} lines")
+        tsv_file = tsv_files[0]
+        print(f"   Found: {tsv_file}")
+        
+        # Decompress lazily while parsing instead of materializing the whole TSV;
+        # the member stays a byte stream so the parser scans raw bytes
+        tsv_size = zf.getinfo(tsv_file).file_size
+        tsv = zf.open(tsv_file)
         
     except requests.RequestException as e:
         print(f"\n❌ Download failed: {e}")
         return False
     except zipfile.BadZipFile as e:
         print(f"\n❌ Invalid ZIP file: {e}")
+        data.close()
         return False
     
     # Parse and insert data
     print("\n📝 Parsing and inserting into database...")
     
-    conn = sqlite3.connect(GWAS_DB)
+    conn = open_bulk_connection(GWAS_DB)
     cursor = conn.cursor()
     
-    # Clear existing data
+    # Grow the file once up front (the TSV size is a rough upper bound)
+    preallocate_database(conn, tsv_size)
+    
+    # Replace the table contents in a single transaction; indexes are
+    # dropped first and rebuilt in one pass after the insert
+    cursor.execute("BEGIN")
+    _drop_indexes(conn, GWAS_INDEXES)
     cursor.execute("DELETE FROM gwas_associations")
     
     # Parse header
-    if not lines:
+    header_line = tsv.readline().decode('utf-8')
+    if not header_line:
         print("❌ No data received")
+        cursor.execute("ROLLBACK")
+        conn.close()
+        tsv.close()
+        zf.close()
+        data.close()
         return False
     
-    header = lines[0].split('\t')
-    header_map = {col.strip().upper(): i for i, col in enumerate(header)}
-    
-    # Column mappings (GWAS Catalog format)
-    col_mappings = {
-        'rsid': ['SNPS', 'SNP_ID_CURRENT', 'STRONGEST SNP-RISK ALLELE'],
-        'chromosome': ['CHR_ID', 'CHROMOSOME'],
-        'position': ['CHR_POS', 'POSITION'],
-        'p_value': ['P-VALUE', 'PVALUE'],
-        'odds_ratio': ['OR OR BETA', 'ODDS RATIO', 'OR'],
-        'trait': ['DISEASE/TRAIT', 'MAPPED_TRAIT', 'TRAIT'],
-        'trait_uri': ['MAPPED_TRAIT_URI'],
-        'study_accession': ['STUDY ACCESSION', 'STUDY_ACCESSION'],
-        'pubmed_id': ['PUBMEDID', 'PUBMED_ID'],
-        'first_author': ['FIRST AUTHOR', 'FIRST_AUTHOR'],
-        'sample_size': ['INITIAL SAMPLE SIZE', 'SAMPLE_SIZE'],
-        'risk_frequency': ['RISK ALLELE FREQUENCY', 'RAF']
-    }
-    
-    def get_col_idx(names: List[str]) -> Optional[int]:
-        for name in names:
-            if name.upper() in header_map:
-                return header_map[name.upper()]
-        return None
+    header = header_line.rstrip('\r\n').split('\t')
     
-    # Find column indices
-    col_indices = {field: get_col_idx(names) for field, names in col_mappings.items()}
+    # Find column indices (GWAS Catalog format)
+    col_indices = _map_columns([col.strip().upper() for col in header], GWAS_COLUMN_ALIASES)
+    insert_columns = gwas_insert_columns(col_indices)
+    if not insert_columns:
+        print("❌ No known GWAS columns in header")
+        cursor.execute("ROLLBACK")
+        conn.close()
+        tsv.close()
+        zf.close()
+        data.close()
+        return False
     
-    # Insert rows
+    # Parse the remaining lines in vectorized chunks. engine='c' pins pandas'
+    # C tokenizer so an option change can never fall back to the Python
+    # parser. It reads the undecoded bytes and finds tabs and line ends in
+    # a single pass; tabs are the only delimiter, quotes are data
     inserted = 0
-    skipped = 0
-    batch = []
-    batch_size = 1000
+    lines = _LineCountingReader(tsv)
+    chunks = pd.read_csv(
+        lines, sep='\t', engine='c', encoding='utf-8', header=None, names=range(len(header)),
+        usecols=sorted(set(col_indices.values())),
+        dtype=str, keep_default_na=False, quoting=csv.QUOTE_NONE,
+        on_bad_lines='skip', chunksize=INSERT_BATCH_SIZE
+    )
     
-    for line in tqdm(lines[1:], desc="Processing", unit="rows"):
-        cols = line.split('\t')
-        
-        try:
-            rsid = cols[col_indices['rsid']] if col_indices['rsid'] is not None and col_indices['rsid'] < len(cols) else None
-            
-            # Extract rsID from "rs123-A" format if needed
-            if rsid and '-' in rsid:
-                rsid = rsid.split('-')[0]
-            
-            # Skip if no rsID
-            if not rsid or not rsid.startswith('rs'):
-                skipped += 1
-                continue
-            
-            # Parse numeric fields safely
-            def safe_float(idx):
-                if idx is None or idx >= len(cols):
-                    return None
-                try:
-                    val = cols[idx].strip()
-                    if not val or val == 'NR' or val == 'NA':
-                        return None
-                    return float(val)
-                except (ValueError, IndexError):
-                    return None
-            
-            def safe_int(idx):
-                val = safe_float(idx)
-                return int(val) if val is not None else None
-            
-            def safe_str(idx):
-                if idx is None or idx >= len(cols):
-                    return None
-                val = cols[idx].strip()
-                return val if val and val != 'NR' else None
-            
-            batch.append((
-                rsid,
-                safe_str(col_indices['chromosome']),
-                safe_int(col_indices['position']),
-                None,  # effect_allele
-                None,  # other_allele
-                safe_float(col_indices['p_value']),
-                safe_float(col_indices['odds_ratio']),
-                None,  # beta
-                None,  # ci_lower
-                None,  # ci_upper
-                safe_str(col_indices['trait']),
-                safe_str(col_indices['trait_uri']),
-                safe_str(col_indices['study_accession']),
-                safe_str(col_indices['pubmed_id']),
-                safe_str(col_indices['first_author']),
-                None,  # publication_date
-                None,  # journal
-                safe_int(col_indices['sample_size']),
-                None,  # ancestry
-                safe_float(col_indices['risk_frequency'])
-            ))
-            
-            if len(batch) >= batch_size:
-                cursor.executemany("""
-                    INSERT INTO gwas_associations (
-                        rsid, chromosome, position, effect_allele, other_allele,
-                        p_value, odds_ratio, beta, ci_lower, ci_upper,
-                        trait, trait_uri, study_accession, pubmed_id, first_author,
-                        publication_date, journal, sample_size, ancestry, risk_frequency
-                    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """, batch)
-                inserted += len(batch)
-                batch = []
-                
-        except Exception as e:
-            skipped += 1
-            continue
+    with tqdm(desc="Processing", unit="rows", **PROGRESS_OPTIONS) as pbar:
+        for chunk in chunks:
+            rows = _parse_gwas_chunk(chunk, col_indices)
+            batch_insert(cursor, "gwas_associations", insert_columns, rows)
+            inserted += len(rows)
+            pbar.update(len(chunk))
+    
+    # Rows without an rsID plus lines the parser dropped
+    skipped = lines.lines - inserted
     
-    # Insert remaining batch
-    if batch:
-        cursor.executemany("""
-            INSERT INTO gwas_associations (
-                rsid, chromosome, position, effect_allele, other_allele,
-                p_value, odds_ratio, beta, ci_lower, ci_upper,
-                trait, trait_uri, study_accession, pubmed_id, first_author,
-                publication_date, journal, sample_size, ancestry, risk_frequency
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """, batch)
-        inserted += len(batch)
-    
-    # Update metadata
+    # Update metadata (one timestamp shared with the state file)
+    finished_at = datetime.now().isoformat()
     cursor.execute(
         "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
-        ("last_update", datetime.now().isoformat())
+        ("last_update", finished_at)
+    )
+    cursor.execute(
+        "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+        ("checksum", checksum)
     )
     
-    conn.commit()
+    create_gwas_indexes(conn)
+    cursor.execute("COMMIT")
     conn.close()
+    tsv.close()
+    zf.close()
+    data.close()
     
     # Update state
-    state["gwas"]["last_update"] = datetime.now().isoformat()
+    state["gwas"]["last_update"] = finished_at
     state["gwas"]["status"] = "complete"
     state["gwas"]["associations"] = inserted
+    state["gwas"]["checksum"] = checksum
     save_state(state)
     
     print(f"\n✅ GWAS update complete!")
@@ -419,15 +725,20 @@ def init_pgs_db() -> None:
         )
     """)
     
-    # Indexes
+    # Indexes (pgs_id is needed by the per-score DELETE during the import;
+    # the rest are built by create_pgs_indexes() afterwards)
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_pgs_variants_pgs_id ON pgs_variants(pgs_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pgs_variants_rsid ON pgs_variants(rsid)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_pgs_trait ON polygenic_scores(trait_name)")
     
     conn.commit()
     conn.close()
 
 
+def create_pgs_indexes(conn: sqlite3.Connection) -> None:
+    """Create the PGS variant lookup indexes (after the bulk insert)."""
+    _create_indexes(conn, PGS_INDEXES)
+
+
 def get_all_pgs_metadata() -> List[Dict]:
     """Fetch metadata for all PGS scores from API."""
     print("\n📊 Fetching PGS Catalog index...")
@@ -439,7 +750,7 @@ def get_all_pgs_metadata() -> List[Dict]:
     with tqdm(desc="Fetching score list", unit="scores") as pbar:
         while next_url:
             try:
-                response = requests.get(next_url, timeout=REQUEST_TIMEOUT)
+                response = SESSION.get(next_url, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -460,93 +771,138 @@ def get_all_pgs_metadata() -> List[Dict]:
     return all_scores
 
 
-def download_pgs_scoring_file(pgs_id: str) -> Optional[List[Dict]]:
+def download_pgs_scoring_file(pgs_id: str,
+                              limiter: Optional[RateLimiter] = None,
+                              session: Optional[requests.Session] = None) -> Optional[List[tuple]]:
     """
     Download scoring file for a PGS score.
     
-    Returns list of variant dictionaries or None if failed.
+    Uses the shared SESSION unless another session is given. Safe to call
+    from worker threads.
+    
+    Returns list of variant tuples (see _parse_scoring_file) or None if failed.
     """
     # Scoring file URL format
     url = f"https://ftp.ebi.ac.uk/pub/databases/spot/pgs/scores/{pgs_id}/ScoringFiles/{pgs_id}.txt.gz"
     
+    if limiter is not None:
+        limiter.acquire()
+    
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        # Decompress gzip
-        content = gzip.decompress(response.content).decode('utf-8')
-        lines = content.strip().split('\n')
-        
-        # Skip header comments
-        data_lines = [l for l in lines if not l.startswith('#')]
-        if not data_lines:
-            return None
-        
-        # Parse header
-        header = data_lines[0].split('\t')
-        header_lower = [h.lower().strip() for h in header]
+        with (session or SESSION).get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            # Undo any transport encoding, then gunzip the file as it arrives
+            # (ISA-L's SIMD inflate when available)
+            response.raw.decode_content = True
+            with (igzip or gzip).GzipFile(fileobj=response.raw) as gz:
+                return _parse_scoring_file(TextIOWrapper(gz, encoding='utf-8'))
         
-        # Map columns
-        col_map = {}
-        for i, col in enumerate(header_lower):
-            if col in ['rsid', 'snp', 'snp_id']:
-                col_map['rsid'] = i
-            elif col in ['chr_name', 'chromosome', 'chr']:
-                col_map['chromosome'] = i
-            elif col in ['chr_position', 'position', 'pos', 'bp']:
-                col_map['position'] = i
-            elif col in ['effect_allele', 'a1', 'allele1', 'ea']:
-                col_map['effect_allele'] = i
-            elif col in ['other_allele', 'a2', 'allele2', 'oa', 'reference_allele']:
-                col_map['other_allele'] = i
-            elif col in ['effect_weight', 'weight', 'beta']:
-                col_map['weight'] = i
-            elif col in ['allelefrequency_effect', 'eaf', 'effect_allele_frequency']:
-                col_map['frequency'] = i
+    except Exception as e:
+        return None
+
+
+def _bounded_as_completed(executor: ThreadPoolExecutor, fn, items: Iterable,
+                          max_pending: int) -> Iterator[Tuple[object, Future]]:
+    """
+    Run fn over items on executor, yielding (item, future) as each completes.
+    Items must not be None.
+    
+    At most max_pending calls are in flight or waiting to be consumed, so a
+    slow consumer holds back new submissions instead of letting finished
+    results pile up in memory.
+    """
+    items = iter(items)
+    pending: Dict[Future, object] = {}
+    
+    def submit_next() -> None:
+        item = next(items, None)
+        if item is not None:
+            pending[executor.submit(fn, item)] = item
+    
+    for _ in range(max_pending):
+        submit_next()
+    
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            submit_next()
+            yield item, future
+
+
+def _parse_scoring_file(lines) -> Optional[List[tuple]]:
+    """
+    Parse the lines of a PGS scoring file.
+    
+    Returns list of variant tuples in PGS_VARIANT_COLUMNS order without the
+    leading pgs_id (rsid, chromosome, position, effect_allele, other_allele,
+    weight, frequency), or None if the file has no weights.
+    """
+    # Skip header comments (they only appear before the column header, so
+    # the data rows are iterated without a per-line filter)
+    lines = iter(lines)
+    header_line = next((l for l in lines if not l.startswith('#')), '').rstrip('\n')
+    if not header_line:
+        return None
+    
+    # Parse header
+    header = header_line.split('\t')
+    col_map = _map_columns([h.lower().strip() for h in header], PGS_COLUMN_ALIASES)
+    
+    # Must have weight column
+    if 'weight' not in col_map:
+        return None
+    
+    # Split each line only up to the last mapped column; unmapped fields
+    # point past the end of the split so they read as None
+    maxsplit = max(col_map.values()) + 1
+    absent = maxsplit + 1
+    weight_idx = col_map['weight']
+    rsid_idx = col_map.get('rsid', absent)
+    chromosome_idx = col_map.get('chromosome', absent)
+    position_idx = col_map.get('position', absent)
+    effect_allele_idx = col_map.get('effect_allele', absent)
+    other_allele_idx = col_map.get('other_allele', absent)
+    frequency_idx = col_map.get('frequency', absent)
+    
+    variants = []
+    for line in lines:
+        cols = line.rstrip('\n').split('\t', maxsplit)
+        n = len(cols)
         
-        # Must have weight column
-        if 'weight' not in col_map:
-            return None
+        try:
+            weight = float(cols[weight_idx])
+        except (ValueError, IndexError):
+            continue
         
-        variants = []
-        for line in data_lines[1:]:
-            cols = line.split('\t')
-            
+        # Parse position
+        position = None
+        if position_idx < n:
             try:
-                weight = float(cols[col_map['weight']])
-            except (ValueError, IndexError):
-                continue
-            
-            variant = {
-                'rsid': cols[col_map.get('rsid', -1)] if col_map.get('rsid', -1) < len(cols) else None,
-                'chromosome': cols[col_map.get('chromosome', -1)] if col_map.get('chromosome', -1) < len(cols) else None,
-                'position': None,
-                'effect_allele': cols[col_map.get('effect_allele', -1)] if col_map.get('effect_allele', -1) < len(cols) else None,
-                'other_allele': cols[col_map.get('other_allele', -1)] if col_map.get('other_allele', -1) < len(cols) else None,
-                'weight': weight,
-                'frequency': None
-            }
-            
-            # Parse position
-            if col_map.get('position') is not None and col_map['position'] < len(cols):
-                try:
-                    variant['position'] = int(cols[col_map['position']])
-                except ValueError:
-                    pass
-            
-            # Parse frequency
-            if col_map.get('frequency') is not None and col_map['frequency'] < len(cols):
-                try:
-                    variant['frequency'] = float(cols[col_map['frequency']])
-                except ValueError:
-                    pass
-            
-            variants.append(variant)
+                position = int(cols[position_idx])
+            except ValueError:
+                pass
         
-        return variants
+        # Parse frequency
+        frequency = None
+        if frequency_idx < n:
+            try:
+                frequency = float(cols[frequency_idx])
+            except ValueError:
+                pass
         
-    except Exception as e:
-        return None
+        variants.append((
+            cols[rsid_idx] if rsid_idx < n else None,
+            cols[chromosome_idx] if chromosome_idx < n else None,
+            position,
+            cols[effect_allele_idx] if effect_allele_idx < n else None,
+            cols[other_allele_idx] if other_allele_idx < n else None,
+            weight,
+            frequency
+        ))
+    
+    return variants
 
 
 def update_pgs(state: Dict, resume: bool = True) -> bool:
@@ -588,8 +944,8 @@ def update_pgs(state: Dict, resume: bool = True) -> bool:
     # Load already processed scores
     processed: Set[str] = set()
     if resume:
-        processed = set(state["pgs"].get("processed_scores", []))
-        failed = set(state["pgs"].get("failed_scores", []))
+        processed = state["pgs"]["processed_scores"]
+        failed = state["pgs"]["failed_scores"]
         print(f"   Already processed: {len(processed):,}")
         print(f"   Previously failed: {len(failed):,}")
     
@@ -597,6 +953,11 @@ def update_pgs(state: Dict, resume: bool = True) -> bool:
     to_process = [s for s in eligible_scores if s.get('id') not in processed]
     
     if not to_process:
+        # An interrupted earlier run may have left the indexes dropped
+        conn = sqlite3.connect(PGS_DB)
+        create_pgs_indexes(conn)
+        conn.commit()
+        conn.close()
         print("\n✅ All eligible scores already downloaded!")
         return True
     
@@ -610,152 +971,164 @@ def update_pgs(state: Dict, resume: bool = True) -> bool:
     print(f"   Estimated time: {format_time(est_seconds)}")
     
     # Connect to database
-    conn = sqlite3.connect(PGS_DB)
+    conn = open_bulk_connection(PGS_DB)
     cursor = conn.cursor()
     
+    # Scores are committed in groups; each runs inside its own savepoint so a
+    # failed score is undone without losing the rest of the group
+    cursor.execute("BEGIN")
+    _drop_indexes(conn, PGS_INDEXES)
+    pending_commit = 0
+    
     # Process scores with weighted progress
     scores_done = 0
     scores_failed = 0
     variants_done = 0
     start_time = time.time()
+    last_postfix = 0.0
     
     # Progress bar based on variants (weighted)
-    pbar = tqdm(total=remaining_variants, desc="Downloading", unit="var", unit_scale=True)
+    pbar = tqdm(total=remaining_variants, desc="Downloading", unit="var", unit_scale=True,
+                **PROGRESS_OPTIONS)
+    
+    # Download and parse scoring files concurrently (rate limited across
+    # workers) while this thread writes finished ones to the database
+    limiter = RateLimiter(1 / REQUEST_DELAY)
+    executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    downloads = _bounded_as_completed(
+        executor,
+        lambda score: download_pgs_scoring_file(score['id'], limiter, SESSION),
+        (score for score in to_process if score.get('id')),
+        DOWNLOAD_WORKERS + DOWNLOAD_QUEUE_SIZE
+    )
     
-    for score in to_process:
-        pgs_id = score.get('id')
-        num_variants = score.get('variants_number', 0)
-        trait = score.get('trait_reported', 'Unknown')
-        
-        if not pgs_id:
-            continue
-        
-        # Download scoring file
-        variants = download_pgs_scoring_file(pgs_id)
-        
-        if variants is None:
-            scores_failed += 1
-            state["pgs"]["failed_scores"] = list(set(state["pgs"].get("failed_scores", [])) | {pgs_id})
-            pbar.update(num_variants)  # Still advance progress
-            continue
-        
-        # Insert score metadata
-        try:
-            # Safe extraction of nested fields
-            trait_efo = score.get('trait_efo') or []
-            trait_efo_id = trait_efo[0].get('id') if isinstance(trait_efo, list) and trait_efo else None
-            
-            publication = score.get('publication') or {}
-            pub_doi = publication.get('doi')
-            pub_date = publication.get('date_publication') or ''
-            pub_year = int(pub_date[:4]) if pub_date and len(pub_date) >= 4 else None
-            pub_title = publication.get('title')
-            
-            samples = score.get('samples_variants') or []
-            sample_size = samples[0].get('sample_number') if isinstance(samples, list) and samples else None
-            
-            # Ancestry: extract from distribution dict
-            ancestry_dist = score.get('ancestry_distribution') or {}
-            gwas_data = ancestry_dist.get('gwas') or {}
-            dist = gwas_data.get('dist') if isinstance(gwas_data, dict) else {}
-            # Get primary ancestry (highest percentage)
-            ancestry = max(dist.keys(), key=lambda k: dist.get(k, 0)) if dist else None
+    try:
+        for score, future in downloads:
+            pgs_id = score.get('id')
+            num_variants = score.get('variants_number', 0)
+            trait = score.get('trait_reported', 'Unknown')
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO polygenic_scores (
-                    pgs_id, trait_name, trait_category, trait_efo_id,
-                    publication_doi, publication_year, publication_title,
-                    sample_size, num_variants, num_variants_downloaded,
-                    ancestry, genome_build, download_status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                pgs_id,
-                trait[:500] if trait else 'Unknown',
-                score.get('trait_category', 'Other'),
-                trait_efo_id,
-                pub_doi,
-                pub_year,
-                pub_title,
-                sample_size,
-                num_variants,
-                len(variants),
-                ancestry,
-                score.get('genome_build'),
-                'complete'
-            ))
+            # Scoring file downloaded by a worker thread
+            variants = future.result()
             
-            # Delete existing variants for this score (for re-downloads)
-            cursor.execute("DELETE FROM pgs_variants WHERE pgs_id = ?", (pgs_id,))
+            if variants is None:
+                scores_failed += 1
+                state["pgs"]["failed_scores"].add(pgs_id)
+                pbar.update(num_variants)  # Still advance progress
+                continue
             
-            # Insert variants in batches
-            batch_size = 1000
-            for i in range(0, len(variants), batch_size):
-                batch = variants[i:i+batch_size]
-                cursor.executemany("""
-                    INSERT INTO pgs_variants (
-                        pgs_id, rsid, chromosome, position,
-                        effect_allele, other_allele, effect_weight, allele_frequency
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, [(
+            # Insert score metadata
+            try:
+                cursor.execute("SAVEPOINT score")
+                
+                # Safe extraction of nested fields
+                trait_efo = score.get('trait_efo') or []
+                trait_efo_id = trait_efo[0].get('id') if isinstance(trait_efo, list) and trait_efo else None
+                
+                publication = score.get('publication') or {}
+                pub_doi = publication.get('doi')
+                pub_date = publication.get('date_publication') or ''
+                pub_year = int(pub_date[:4]) if pub_date and len(pub_date) >= 4 else None
+                pub_title = publication.get('title')
+                
+                samples = score.get('samples_variants') or []
+                sample_size = samples[0].get('sample_number') if isinstance(samples, list) and samples else None
+                
+                # Ancestry: extract from distribution dict
+                ancestry_dist = score.get('ancestry_distribution') or {}
+                gwas_data = ancestry_dist.get('gwas') or {}
+                dist = gwas_data.get('dist') if isinstance(gwas_data, dict) else {}
+                # Get primary ancestry (highest percentage)
+                ancestry = max(dist.keys(), key=lambda k: dist.get(k, 0)) if dist else None
+                
+                cursor.execute("""
+                    INSERT OR REPLACE INTO polygenic_scores (
+                        pgs_id, trait_name, trait_category, trait_efo_id,
+                        publication_doi, publication_year, publication_title,
+                        sample_size, num_variants, num_variants_downloaded,
+                        ancestry, genome_build, download_status
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
                     pgs_id,
-                    v['rsid'],
-                    v['chromosome'],
-                    v['position'],
-                    v['effect_allele'],
-                    v['other_allele'],
-                    v['weight'],
-                    v['frequency']
-                ) for v in batch])
-            
-            conn.commit()
+                    trait[:500] if trait else 'Unknown',
+                    score.get('trait_category', 'Other'),
+                    trait_efo_id,
+                    pub_doi,
+                    pub_year,
+                    pub_title,
+                    sample_size,
+                    num_variants,
+                    len(variants),
+                    ancestry,
+                    score.get('genome_build'),
+                    'complete'
+                ))
+                
+                # Delete existing variants for this score (for re-downloads)
+                cursor.execute("DELETE FROM pgs_variants WHERE pgs_id = ?", (pgs_id,))
+                
+                # Insert variants, streaming the rows into batch_insert
+                batch_insert(cursor, "pgs_variants", PGS_VARIANT_COLUMNS,
+                             ((pgs_id,) + v for v in variants))
+                
+                cursor.execute("RELEASE score")
+                
+                scores_done += 1
+                variants_done += len(variants)
+                state["pgs"]["processed_scores"].add(pgs_id)
+                state["pgs"]["failed_scores"].discard(pgs_id)  # retried successfully
+                
+                # Commit periodically; state is saved only once rows are durable
+                pending_commit += 1
+                if pending_commit >= PGS_COMMIT_INTERVAL:
+                    cursor.execute("COMMIT")
+                    save_state(state)
+                    cursor.execute("BEGIN")
+                    pending_commit = 0
             
-            scores_done += 1
-            variants_done += len(variants)
+            except sqlite3.Error as e:
+                scores_failed += 1
+                cursor.execute("ROLLBACK TO score")
+                cursor.execute("RELEASE score")
             
-            # Update state (save periodically)
-            state["pgs"]["processed_scores"] = list(set(state["pgs"].get("processed_scores", [])) | {pgs_id})
-            if scores_done % 10 == 0:
-                save_state(state)
+            # Update progress bar
+            pbar.update(num_variants)
             
-        except sqlite3.Error as e:
-            scores_failed += 1
-            conn.rollback()
-        
-        # Update progress bar
-        pbar.update(num_variants)
-        
-        # Update ETA in description
-        elapsed = time.time() - start_time
-        if variants_done > 0:
-            rate = variants_done / elapsed
-            remaining = remaining_variants - pbar.n
-            eta = remaining / rate if rate > 0 else 0
-            pbar.set_postfix({
-                'scores': scores_done,
-                'failed': scores_failed,
-                'ETA': format_time(eta)
-            })
-        
-        # Rate limiting
-        time.sleep(REQUEST_DELAY)
+            # Update ETA in description (at most once per POSTFIX_INTERVAL)
+            now = time.time()
+            if variants_done > 0 and now - last_postfix >= POSTFIX_INTERVAL:
+                last_postfix = now
+                rate = variants_done / (now - start_time)
+                remaining = remaining_variants - pbar.n
+                eta = remaining / rate if rate > 0 else 0
+                pbar.set_postfix({
+                    'scores': scores_done,
+                    'failed': scores_failed,
+                    'ETA': format_time(eta)
+                }, refresh=False)
+    
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
     
     pbar.close()
     
+    # Update metadata (one timestamp shared with the state file)
+    finished_at = datetime.now().isoformat()
+    cursor.execute(
+        "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+        ("last_update", finished_at)
+    )
+    create_pgs_indexes(conn)
+    cursor.execute("COMMIT")
+    conn.close()
+    
     # Final state update
-    state["pgs"]["last_update"] = datetime.now().isoformat()
+    state["pgs"]["last_update"] = finished_at
     state["pgs"]["status"] = "complete"
     state["pgs"]["total_scores"] = scores_done
     state["pgs"]["total_variants"] = variants_done
     save_state(state)
     
-    # Update metadata
-    cursor.execute(
-        "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
-        ("last_update", datetime.now().isoformat())
-    )
-    conn.commit()
-    conn.close()
-    
     # Summary
     elapsed = time.time() - start_time
     print(f"\n✅ PGS update complete!")
@@ -883,8 +1256,8 @@ Notes:
             state["pgs"] = {
                 "last_update": None,
                 "status": "never",
-                "processed_scores": [],
-                "failed_scores": [],
+                "processed_scores": set(),
+                "failed_scores": set(),
                 "total_scores": 0,
                 "total_variants": 0
             }
@@ -4,23 +4,31 @@ Main window UI for the Genetic Analysis Application.
 Implements PyQt6 interface with tabbed layout for monogenic and polygenic analysis.
 """
 
+from functools import lru_cache
+import math
 from typing import List, Optional
+import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QFileDialog, QLabel, QLineEdit,
+    QTableView, QFileDialog, QLabel, QLineEdit,
     QComboBox, QSlider, QProgressBar, QStatusBar, QMessageBox,
     QHeaderView, QGroupBox, QSpinBox, QFrame, QSplitter, QApplication,
-    QDialog, QTextEdit, QTextBrowser, QScrollArea, QDialogButtonBox, QTabWidget
+    QDialog, QTextEdit, QTextBrowser, QScrollArea, QDialogButtonBox, QTabWidget,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt6.QtGui import QFont, QColor, QDesktopServices
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QUrl, QAbstractTableModel, QModelIndex,
+    QEvent, QRect, QSize
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor, QDesktopServices, QPainter
 
-from models.data_models import SNPRecord, GWASMatch, FilterCriteria
+from models.data_models import SNPRecord, GWASMatch, FilterCriteria, MatchArrays
 from models.polygenic_models import PolygenicResult
 from backend.parsers import Parser23andMe, ParseError
 from backend.search_engine import SearchEngine, DatabaseError
 from backend.scoring import get_score_interpretation
 from backend.session_manager import SessionManager
+from backend.result_cache import ResultCache
 from frontend.polygenic_widgets import (
     PolygenicBrowserWidget, DatabaseSettingsWidget
 )
@@ -43,15 +51,19 @@ class ProcessingWorker(QThread):
         file_progress: Emitted with file loading progress (0-100, message).
         mono_progress: Emitted with monogenic analysis progress (0-100, message).
     """
-    finished = pyqtSignal(list, dict, list)
+    # object, not list: a list signal argument is converted element by element
+    # into a QVariantList and back, which copies the ~600k SNP records
+    finished = pyqtSignal(object, dict, object)
     error = pyqtSignal(str)
     file_progress = pyqtSignal(int, str)
     mono_progress = pyqtSignal(int, str)
     
-    def __init__(self, filepath: str, search_engine: SearchEngine) -> None:
+    def __init__(self, filepath: str, search_engine: SearchEngine,
+                 result_cache: Optional[ResultCache] = None) -> None:
         super().__init__()
         self.filepath = filepath
         self.search_engine = search_engine
+        self.result_cache = result_cache
         self._is_cancelled = False
     
     def run(self) -> None:
@@ -60,14 +72,36 @@ class ProcessingWorker(QThread):
             self.file_progress.emit(5, "Opening file...")
             self.mono_progress.emit(0, "Waiting...")
             
+            # A file already processed against this database is served from the cache
+            cache_key = None
+            if self.result_cache is not None:
+                try:
+                    cache_key = self.result_cache.make_key(self.filepath, self.search_engine.db_path)
+                except OSError as e:
+                    logger.warning(f"Could not fingerprint {self.filepath}: {e}")
+            
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                snp_records, matches, stats = cached
+                self.file_progress.emit(100, f"✓ {len(snp_records):,} SNPs loaded (cached)")
+                self.mono_progress.emit(100, f"✓ {len(matches):,} matches found (cached)")
+                self.finished.emit(matches, stats, snp_records)
+                return
+            
             parser = Parser23andMe()
             
+            last_parse_percent = -1
+            
             # Set up progress callback for file parsing
             def parsing_progress(lines_processed: int, total_lines: int) -> None:
+                nonlocal last_parse_percent
                 if total_lines > 0:
-                    progress_percent = int((lines_processed / total_lines) * 100)
-                    self.file_progress.emit(progress_percent, 
-                                           f"{lines_processed:,}/{total_lines:,} lines")
+                    progress_percent = (100 * lines_processed) // total_lines
+                    # Skip emits that would not move the bar
+                    if progress_percent != last_parse_percent:
+                        last_parse_percent = progress_percent
+                        self.file_progress.emit(progress_percent,
+                                                f"{lines_processed:,}/{total_lines:,} lines")
             
             parser.set_progress_callback(parsing_progress)
             snp_records = parser.parse_file(self.filepath)
@@ -81,7 +115,22 @@ class ProcessingWorker(QThread):
             # Monogenic analysis
             self.mono_progress.emit(10, f"Matching {len(snp_records):,} SNPs...")
             
-            matches = self.search_engine.match_user_snps(snp_records)
+            last_percent = -1
+            
+            def matching_progress(snps_matched: int, total_snps: int) -> None:
+                nonlocal last_percent
+                # Matching runs 10-95%; skip emits that would not move the bar
+                percent = 10 + (85 * snps_matched) // total_snps
+                if percent != last_percent:
+                    last_percent = percent
+                    self.mono_progress.emit(percent,
+                                            f"Matched {snps_matched:,}/{total_snps:,} SNPs")
+            
+            matches = self.search_engine.match_user_snps(
+                snp_records,
+                progress_callback=matching_progress,
+                should_cancel=lambda: self._is_cancelled
+            )
             
             if self._is_cancelled:
                 return
@@ -91,6 +140,10 @@ class ProcessingWorker(QThread):
             stats['matches_found'] = len(matches)
             self.finished.emit(matches, stats, snp_records)
             
+            # Stored after the results are handed over so they show without waiting on the write
+            if cache_key:
+                self.result_cache.put(cache_key, snp_records, matches, stats)
+        
         except ParseError as e:
             logger.error(f"Parse error: {e}")
             self.error.emit(f"Error reading file: {str(e)}")
@@ -364,6 +417,122 @@ python update_databases.py --pgs     # Update only PGS Catalog
         """
 
 
+@lru_cache(maxsize=256)
+def _render_explanation(rsid: str, chromosome: str, position: int, gene: Optional[str],
+                        trait: str, category: str, risk_allele: str, user_genotype: str,
+                        p_value: float, odds_ratio: Optional[float], sample_size: Optional[int],
+                        allele_frequency: float, impact_score: float) -> str:
+    """
+    Build the HTML explanation for a GWAS match.
+    
+    Takes the match fields as plain values so the result can be cached;
+    reopening the same row reuses the rendered page.
+    """
+    # Calculate score components for explanation
+    neg_log_p = -math.log10(p_value) if p_value > 0 else 0
+    p_score = min(neg_log_p / 10, 1.0) * 7.0
+    af_score = (1 - allele_frequency) * 3.0
+    
+    # Risk allele analysis
+    has_risk = risk_allele in user_genotype
+    risk_count = user_genotype.count(risk_allele)
+    if risk_count == 2:
+        risk_status = f"<span style='color: #b00000;'><b>Homozygous for risk allele</b> (2 copies)</span>"
+    elif risk_count == 1:
+        risk_status = f"<span style='color: #b06000;'><b>Heterozygous</b> (1 copy of risk allele)</span>"
+    else:
+        risk_status = "<span style='color: #006000;'><b>No risk allele</b> (0 copies)</span>"
+    
+    # Format odds ratio
+    odds_ratio_str = f"{odds_ratio:.2f}" if odds_ratio else "Not available"
+    
+    # Format sample size
+    sample_size_str = f"{sample_size:,} individuals" if sample_size else "Not available"
+    
+    return f"""
+    <h2>Variant Information</h2>
+    <table border="0" cellpadding="5" style="width: 100%;">
+        <tr><td><b>SNP ID:</b></td><td>{rsid}</td></tr>
+        <tr><td><b>Chromosome:</b></td><td>{chromosome}</td></tr>
+        <tr><td><b>Position:</b></td><td>{position:,}</td></tr>
+        <tr><td><b>Gene:</b></td><td>{gene or 'Intergenic (not in a gene)'}</td></tr>
+    </table>
+    
+    <h2>Association Details</h2>
+    <table border="0" cellpadding="5" style="width: 100%;">
+        <tr><td><b>Associated Trait:</b></td><td>{trait}</td></tr>
+        <tr><td><b>Category:</b></td><td>{category}</td></tr>
+        <tr><td><b>Risk Allele:</b></td><td>{risk_allele}</td></tr>
+        <tr><td><b>Odds Ratio:</b></td><td>{odds_ratio_str}</td></tr>
+        <tr><td><b>Study Sample Size:</b></td><td>{sample_size_str}</td></tr>
+    </table>
+    
+    <h2>Your Genotype Analysis</h2>
+    <table border="0" cellpadding="5" style="width: 100%;">
+        <tr><td><b>Your Genotype:</b></td><td><b style="font-size: 14pt;">{user_genotype}</b></td></tr>
+        <tr><td><b>Risk Allele Status:</b></td><td>{risk_status}</td></tr>
+    </table>
+    
+    <h2>Statistical Significance</h2>
+    <table border="0" cellpadding="5" style="width: 100%;">
+        <tr><td><b>P-value:</b></td><td>{p_value:.2e}</td></tr>
+        <tr><td><b>-log₁₀(p-value):</b></td><td>{neg_log_p:.2f}</td></tr>
+        <tr><td><b>Interpretation:</b></td><td>
+            {'Highly significant (p < 5×10⁻⁸)' if p_value < 5e-8 else 
+             'Significant (p < 0.001)' if p_value < 0.001 else
+             'Suggestive (p < 0.05)' if p_value < 0.05 else 'Not significant'}</td></tr>
+    </table>
+    
+    <h2>Population Frequency</h2>
+    <table border="0" cellpadding="5" style="width: 100%;">
+        <tr><td><b>Allele Frequency:</b></td><td>{allele_frequency:.1%}</td></tr>
+        <tr><td><b>Interpretation:</b></td><td>
+            {'Very rare variant (<1%)' if allele_frequency < 0.01 else
+             'Rare variant (1-5%)' if allele_frequency < 0.05 else
+             'Low frequency (5-10%)' if allele_frequency < 0.10 else
+             'Common variant (≥10%)'}</td></tr>
+    </table>
+    
+    <h2>Impact Score Calculation</h2>
+    <p>The Impact Score combines statistical significance with variant rarity:</p>
+    <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
+        <tr style="background-color: #e0e0e0;">
+            <th>Component</th>
+            <th>Formula</th>
+            <th>Value</th>
+        </tr>
+        <tr>
+            <td>P-value Score</td>
+            <td>min(-log₁₀(p) / 10, 1) × 7</td>
+            <td>{p_score:.2f}</td>
+        </tr>
+        <tr>
+            <td>Rarity Score</td>
+            <td>(1 - allele_frequency) × 3</td>
+            <td>{af_score:.2f}</td>
+        </tr>
+        <tr style="background-color: #ffffcc;">
+            <td><b>Total Impact Score</b></td>
+            <td>P-value + Rarity (clamped 0-10)</td>
+            <td><b>{impact_score:.2f}</b></td>
+        </tr>
+    </table>
+    
+    <h2>What This Means</h2>
+    <p>This variant ({rsid}) has been associated with <b>{trait}</b> in genome-wide 
+    association studies{f' involving {sample_size:,} participants' if sample_size else ''}.</p>
+    
+    {'<p style="color: #b00000;">⚠️ You carry ' + str(risk_count) + ' cop' + ('y' if risk_count == 1 else 'ies') + 
+     ' of the risk allele. This may indicate a slightly increased statistical risk, but genetics is only one factor among many.</p>' 
+     if has_risk else 
+     '<p style="color: #006000;">✓ You do not carry the risk allele for this association.</p>'}
+    
+    <p><b>Remember:</b> Statistical association does not mean causation. Many genetic 
+    and environmental factors influence traits and disease risk. Consult healthcare 
+    professionals for personalized interpretation.</p>
+    """
+
+
 class ExplainDialog(QDialog):
     """
     Dialog showing detailed explanation for a specific GWAS match.
@@ -371,10 +540,17 @@ class ExplainDialog(QDialog):
     
     def __init__(self, match: GWASMatch, parent=None) -> None:
         super().__init__(parent)
-        self.match = match
-        self.setWindowTitle(f"Details: {match.rsid} - {match.trait[:50]}")
         self.setMinimumSize(650, 550)
         self._init_ui()
+        self.set_match(match)
+    
+    def set_match(self, match: GWASMatch) -> None:
+        """Show the explanation for another match, reusing the dialog's widgets."""
+        self.match = match
+        self.setWindowTitle(f"Details: {match.rsid} - {match.trait[:50]}")
+        self.explain_text.setHtml(self._get_explanation())
+        self.gene_btn.setText(f"🔗 Gene: {match.gene}")
+        self.gene_btn.setVisible(bool(match.gene))
     
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -386,12 +562,11 @@ class ExplainDialog(QDialog):
         content = QWidget()
         content_layout = QVBoxLayout(content)
         
-        explain_text = QTextEdit()
-        explain_text.setReadOnly(True)
-        explain_text.setHtml(self._get_explanation())
-        explain_text.setMinimumHeight(400)
+        self.explain_text = QTextEdit()
+        self.explain_text.setReadOnly(True)
+        self.explain_text.setMinimumHeight(400)
         
-        content_layout.addWidget(explain_text)
+        content_layout.addWidget(self.explain_text)
         scroll.setWidget(content)
         layout.addWidget(scroll)
         
@@ -407,10 +582,10 @@ class ExplainDialog(QDialog):
         gwas_btn.clicked.connect(self._open_gwas_catalog)
         button_layout.addWidget(gwas_btn)
         
-        if self.match.gene:
-            gene_btn = QPushButton(f"🔗 Gene: {self.match.gene}")
-            gene_btn.clicked.connect(self._open_gene_info)
-            button_layout.addWidget(gene_btn)
+        # Text and visibility are set per match in set_match
+        self.gene_btn = QPushButton()
+        self.gene_btn.clicked.connect(self._open_gene_info)
+        button_layout.addWidget(self.gene_btn)
         
         button_layout.addStretch()
         
@@ -422,111 +597,11 @@ class ExplainDialog(QDialog):
     
     def _get_explanation(self) -> str:
         m = self.match
-        
-        # Calculate score components for explanation
-        import math
-        neg_log_p = -math.log10(m.p_value) if m.p_value > 0 else 0
-        p_score = min(neg_log_p / 10, 1.0) * 7.0
-        af_score = (1 - m.allele_frequency) * 3.0
-        
-        # Risk allele analysis
-        has_risk = m.risk_allele in m.user_genotype
-        risk_count = m.user_genotype.count(m.risk_allele)
-        if risk_count == 2:
-            risk_status = f"<span style='color: #b00000;'><b>Homozygous for risk allele</b> (2 copies)</span>"
-        elif risk_count == 1:
-            risk_status = f"<span style='color: #b06000;'><b>Heterozygous</b> (1 copy of risk allele)</span>"
-        else:
-            risk_status = "<span style='color: #006000;'><b>No risk allele</b> (0 copies)</span>"
-        
-        # Format odds ratio
-        odds_ratio_str = f"{m.odds_ratio:.2f}" if m.odds_ratio else "Not available"
-        
-        # Format sample size
-        sample_size_str = f"{m.sample_size:,} individuals" if m.sample_size else "Not available"
-        
-        return f"""
-        <h2>Variant Information</h2>
-        <table border="0" cellpadding="5" style="width: 100%;">
-            <tr><td><b>SNP ID:</b></td><td>{m.rsid}</td></tr>
-            <tr><td><b>Chromosome:</b></td><td>{m.chromosome}</td></tr>
-            <tr><td><b>Position:</b></td><td>{m.position:,}</td></tr>
-            <tr><td><b>Gene:</b></td><td>{m.gene or 'Intergenic (not in a gene)'}</td></tr>
-        </table>
-        
-        <h2>Association Details</h2>
-        <table border="0" cellpadding="5" style="width: 100%;">
-            <tr><td><b>Associated Trait:</b></td><td>{m.trait}</td></tr>
-            <tr><td><b>Category:</b></td><td>{m.category}</td></tr>
-            <tr><td><b>Risk Allele:</b></td><td>{m.risk_allele}</td></tr>
-            <tr><td><b>Odds Ratio:</b></td><td>{odds_ratio_str}</td></tr>
-            <tr><td><b>Study Sample Size:</b></td><td>{sample_size_str}</td></tr>
-        </table>
-        
-        <h2>Your Genotype Analysis</h2>
-        <table border="0" cellpadding="5" style="width: 100%;">
-            <tr><td><b>Your Genotype:</b></td><td><b style="font-size: 14pt;">{m.user_genotype}</b></td></tr>
-            <tr><td><b>Risk Allele Status:</b></td><td>{risk_status}</td></tr>
-        </table>
-        
-        <h2>Statistical Significance</h2>
-        <table border="0" cellpadding="5" style="width: 100%;">
-            <tr><td><b>P-value:</b></td><td>{m.p_value:.2e}</td></tr>
-            <tr><td><b>-log₁₀(p-value):</b></td><td>{neg_log_p:.2f}</td></tr>
-            <tr><td><b>Interpretation:</b></td><td>
-                {'Highly significant (p < 5×10⁻⁸)' if m.p_value < 5e-8 else 
-                 'Significant (p < 0.001)' if m.p_value < 0.001 else
-                 'Suggestive (p < 0.05)' if m.p_value < 0.05 else 'Not significant'}</td></tr>
-        </table>
-        
-        <h2>Population Frequency</h2>
-        <table border="0" cellpadding="5" style="width: 100%;">
-            <tr><td><b>Allele Frequency:</b></td><td>{m.allele_frequency:.1%}</td></tr>
-            <tr><td><b>Interpretation:</b></td><td>
-                {'Very rare variant (<1%)' if m.allele_frequency < 0.01 else
-                 'Rare variant (1-5%)' if m.allele_frequency < 0.05 else
-                 'Low frequency (5-10%)' if m.allele_frequency < 0.10 else
-                 'Common variant (≥10%)'}</td></tr>
-        </table>
-        
-        <h2>Impact Score Calculation</h2>
-        <p>The Impact Score combines statistical significance with variant rarity:</p>
-        <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
-            <tr style="background-color: #e0e0e0;">
-                <th>Component</th>
-                <th>Formula</th>
-                <th>Value</th>
-            </tr>
-            <tr>
-                <td>P-value Score</td>
-                <td>min(-log₁₀(p) / 10, 1) × 7</td>
-                <td>{p_score:.2f}</td>
-            </tr>
-            <tr>
-                <td>Rarity Score</td>
-                <td>(1 - allele_frequency) × 3</td>
-                <td>{af_score:.2f}</td>
-            </tr>
-            <tr style="background-color: #ffffcc;">
-                <td><b>Total Impact Score</b></td>
-                <td>P-value + Rarity (clamped 0-10)</td>
-                <td><b>{m.impact_score:.2f}</b></td>
-            </tr>
-        </table>
-        
-        <h2>What This Means</h2>
-        <p>This variant ({m.rsid}) has been associated with <b>{m.trait}</b> in genome-wide 
-        association studies{f' involving {m.sample_size:,} participants' if m.sample_size else ''}.</p>
-        
-        {'<p style="color: #b00000;">⚠️ You carry ' + str(risk_count) + ' cop' + ('y' if risk_count == 1 else 'ies') + 
-         ' of the risk allele. This may indicate a slightly increased statistical risk, but genetics is only one factor among many.</p>' 
-         if has_risk else 
-         '<p style="color: #006000;">✓ You do not carry the risk allele for this association.</p>'}
-        
-        <p><b>Remember:</b> Statistical association does not mean causation. Many genetic 
-        and environmental factors influence traits and disease risk. Consult healthcare 
-        professionals for personalized interpretation.</p>
-        """
+        return _render_explanation(
+            m.rsid, m.chromosome, m.position, m.gene, m.trait, m.category,
+            m.risk_allele, m.user_genotype, m.p_value, m.odds_ratio, m.sample_size,
+            m.allele_frequency, m.impact_score
+        )
     
     def _open_dbsnp(self) -> None:
         url = f"https://www.ncbi.nlm.nih.gov/snp/{self.match.rsid}"
@@ -542,6 +617,242 @@ class ExplainDialog(QDialog):
             QDesktopServices.openUrl(QUrl(url))
 
 
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Table model for one page of GWAS matches.
+    
+    Holds references to the window's match list and its filtered order
+    rather than copies, so a page refresh only resets the row window.
+    Cell text and styling for the page are formatted once per refresh,
+    since the view calls data() again on every repaint.
+    """
+    
+    HEADERS = [
+        "SNP ID", "Gene", "Trait", "User Genotype",
+        "Risk Allele", "P-value", "Category", "Impact Score", "Interpretation", ""
+    ]
+    
+    # Shared across all cells; built on first use since they need a QApplication
+    _score_colors: Optional[tuple] = None
+    _risk_color: Optional[QColor] = None
+    _risk_font: Optional[QFont] = None
+    
+    # Roles data() answers; each paint also asks for decoration, alignment
+    # and check state of every visible cell
+    _DATA_ROLES = frozenset(int(role) for role in (
+        Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.FontRole
+    ))
+    
+    _SORT_KEYS = {
+        0: lambda m: m.rsid,
+        1: lambda m: m.gene or "",
+        2: lambda m: m.trait,
+        3: lambda m: m.user_genotype,
+        4: lambda m: m.risk_allele,
+        5: lambda m: m.p_value,
+        6: lambda m: m.category,
+        7: lambda m: m.impact_score,
+        8: lambda m: m.impact_score,
+    }
+    
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._matches: List[GWASMatch] = []
+        self._order = np.empty(0, dtype=np.intp)
+        self._start = 0
+        self._end = 0
+        # Last sort requested by the view; -1 until the header sorts
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        # Per page row: (cell texts, score colour or None, has risk allele)
+        self._rows: List[tuple] = []
+        
+        if ResultsTableModel._risk_font is None:
+            ResultsTableModel._score_colors = (
+                QColor(255, 200, 200), QColor(255, 230, 200), QColor(255, 255, 200)
+            )
+            ResultsTableModel._risk_color = QColor(180, 0, 0)
+            ResultsTableModel._risk_font = QFont('Arial', 10, QFont.Weight.Bold)
+    
+    def set_page(self, matches: List[GWASMatch], order: np.ndarray, start: int, end: int) -> None:
+        """Show the matches at positions order[start:end] without copying either."""
+        self.beginResetModel()
+        self._matches = matches
+        self._order = order
+        self._start = start
+        self._end = end
+        # The header keeps its sort indicator across pages, so each new page
+        # is shown in that order as well
+        self._sort_page()
+        self._build_rows()
+        self.endResetModel()
+    
+    def _build_rows(self) -> None:
+        """Format the display values of the current page."""
+        colors = self._score_colors
+        matches = self._matches
+        rows = []
+        for i in self._order[self._start:self._end].tolist():
+            match = matches[i]
+            score = match.impact_score
+            texts = (
+                match.rsid,
+                match.gene or "-",
+                match.trait,
+                match.user_genotype,
+                match.risk_allele,
+                f"{match.p_value:.2e}",
+                match.category,
+                f"{score:.2f}",
+                get_score_interpretation(score),
+                None
+            )
+            # Color coding for impact score
+            if score >= 8:
+                color = colors[0]
+            elif score >= 6:
+                color = colors[1]
+            elif score >= 4:
+                color = colors[2]
+            else:
+                color = None
+            rows.append((texts, color, match.has_risk_allele()))
+        self._rows = rows
+    
+    def match_at(self, row: int) -> GWASMatch:
+        """Return the match displayed in the given row."""
+        return self._matches[self._order[self._start + row]]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._end - self._start
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # Most calls are for roles this model never sets; answer those first
+        if role not in self._DATA_ROLES or not index.isValid():
+            return None
+        
+        texts, color, has_risk = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return texts[col]
+        
+        if role == Qt.ItemDataRole.BackgroundRole and col == 7:
+            return color
+        
+        # Highlight if user has risk allele
+        if col == 3 and has_risk:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._risk_color
+            if role == Qt.ItemDataRole.FontRole:
+                return self._risk_font
+        
+        return None
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the rows of the current page in place; later pages keep the sort."""
+        self._sort_column = column
+        self._sort_order = order
+        if column not in self._SORT_KEYS or self._end <= self._start:
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        self._sort_page()
+        self._build_rows()
+        self.layoutChanged.emit()
+    
+    def _sort_page(self) -> None:
+        """Reorder order[start:end] by the last requested sort."""
+        key = self._SORT_KEYS.get(self._sort_column)
+        if key is None or self._end <= self._start:
+            return
+        
+        matches = self._matches
+        self._order[self._start:self._end] = sorted(
+            self._order[self._start:self._end].tolist(), key=lambda i: key(matches[i]),
+            reverse=self._sort_order == Qt.SortOrder.DescendingOrder
+        )
+
+
+class ExplainButtonDelegate(QStyledItemDelegate):
+    """
+    Paints an Explain button in each cell of a column.
+    
+    The buttons are drawn rather than placed as widgets, so a page of
+    results creates no child widgets. Emits clicked(row) when the button
+    area of a cell is clicked.
+    """
+    
+    clicked = pyqtSignal(int)
+    
+    TEXT = "🔍 Explain"
+    MARGIN = 3
+    
+    # Built on first use since they need a QApplication
+    _color: Optional[QColor] = None
+    _hover_color: Optional[QColor] = None
+    _text_color: Optional[QColor] = None
+    
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        if ExplainButtonDelegate._color is None:
+            ExplainButtonDelegate._color = QColor("#5cb85c")
+            ExplainButtonDelegate._hover_color = QColor("#449d44")
+            ExplainButtonDelegate._text_color = QColor("white")
+        # Derived from the view font on first paint; every cell shares them
+        self._button_font: Optional[QFont] = None
+        self._size_hint: Optional[QSize] = None
+    
+    def _font(self, option: QStyleOptionViewItem) -> QFont:
+        if self._button_font is None:
+            font = QFont(option.font)
+            font.setPixelSize(11)
+            font.setBold(True)
+            self._button_font = font
+        return self._button_font
+    
+    def _button_rect(self, rect: QRect) -> QRect:
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._hover_color if hovered else self._color)
+        painter.drawRoundedRect(self._button_rect(option.rect), 3, 3)
+        painter.setPen(self._text_color)
+        painter.setFont(self._font(option))
+        painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, self.TEXT)
+        painter.restore()
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        if self._size_hint is None:
+            text_width = QFontMetrics(self._font(option)).horizontalAdvance(self.TEXT)
+            self._size_hint = QSize(text_width + 16 + 2 * self.MARGIN, 24 + 2 * self.MARGIN)
+        return self._size_hint
+    
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem,
+                    index: QModelIndex) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for the Genetic Analysis Application.
@@ -557,13 +868,20 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         self.all_matches: List[GWASMatch] = []
-        self.filtered_matches: List[GWASMatch] = []
+        # Positions in all_matches of the filtered matches, in display order
+        self.filtered_indices = np.empty(0, dtype=np.intp)
+        self._last_criteria: Optional[FilterCriteria] = None
+        self._match_arrays: Optional[MatchArrays] = None
+        # Built on first use and kept for later opens
+        self._help_dialog: Optional[HelpDialog] = None
+        self._explain_dialog: Optional[ExplainDialog] = None
         self.current_page = 0
         self.worker: Optional[ProcessingWorker] = None
         self.snp_records: List[SNPRecord] = []
         self.polygenic_results: List[PolygenicResult] = []
         
         self.search_engine = SearchEngine(DATABASE_PATH)
+        self.result_cache = ResultCache()
         
         self._init_ui()
         self._setup_connections()
@@ -797,12 +1115,17 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.results_label)
         
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(10)
-        self.results_table.setHorizontalHeaderLabels([
-            "SNP ID", "Gene", "Trait", "User Genotype", 
-            "Risk Allele", "P-value", "Category", "Impact Score", "Interpretation", ""
-        ])
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.explain_delegate = ExplainButtonDelegate(self.results_table)
+        self.explain_delegate.clicked.connect(
+            lambda row: self._show_explain_dialog(self.results_model.match_at(row))
+        )
+        self.results_table.setItemDelegateForColumn(9, self.explain_delegate)
+        # Needed for the delegate's hover colour
+        self.results_table.setMouseTracking(True)
         
         header = self.results_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -816,6 +1139,12 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(9, QHeaderView.ResizeMode.ResizeToContents)
         
+        # Fixed row heights let the view size its scroll range without
+        # measuring every row
+        row_header = self.results_table.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(32)
+        
         self.results_table.setSortingEnabled(True)
         self.results_table.setAlternatingRowColors(True)
         
@@ -894,12 +1223,12 @@ class MainWindow(QMainWindow):
             QPushButton:disabled {
                 background-color: #cccccc;
             }
-            QTableWidget {
+            QTableView {
                 gridline-color: #ddd;
                 background-color: white;
                 alternate-background-color: #f9f9f9;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -948,14 +1277,19 @@ class MainWindow(QMainWindow):
         # Real-time filter connections
         self.score_slider.valueChanged.connect(self._on_score_changed)
         self.pvalue_slider.valueChanged.connect(self._on_pvalue_changed)
-        self.category_combo.currentTextChanged.connect(self._apply_filters)
-        self.carrier_combo.currentTextChanged.connect(self._apply_filters)
+        self.category_combo.currentTextChanged.connect(self._on_filter_changed)
+        self.carrier_combo.currentTextChanged.connect(self._on_filter_changed)
         self.search_input.textChanged.connect(self._on_search_changed)
         
         # Debounce timer for search
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self._apply_filters)
+        
+        # Shorter debounce for sliders and combos, which fire on every drag step
+        self._filter_timer = QTimer()
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._apply_filters)
     
     def _verify_database(self) -> None:
         """Verify the database exists and is valid."""
@@ -1000,7 +1334,7 @@ class MainWindow(QMainWindow):
         self.poly_progress_label.setText("📊 Polygenic Analysis")
         self.progress_label.setText("Loading genetic data...")
         
-        self.worker = ProcessingWorker(filepath, self.search_engine)
+        self.worker = ProcessingWorker(filepath, self.search_engine, self.result_cache)
         self.worker.file_progress.connect(self._on_file_progress)
         self.worker.mono_progress.connect(self._on_mono_progress)
         self.worker.finished.connect(self._on_processing_finished)
@@ -1039,7 +1373,8 @@ class MainWindow(QMainWindow):
         self.upload_btn.setEnabled(True)
         self.filters_group.setEnabled(True)
         
-        self.all_matches = matches
+        # Sorted once here; filtering preserves this order
+        self.all_matches = sorted(matches, key=lambda m: m.impact_score, reverse=True)
         self.snp_records = snp_records
         self.current_page = 0
         
@@ -1159,7 +1494,7 @@ class MainWindow(QMainWindow):
         """Handle score slider change."""
         score = value / 10.0
         self.score_value_label.setText(f"{score:.1f}")
-        self._apply_filters()
+        self._filter_timer.start(75)
     
     def _on_pvalue_changed(self, value: int) -> None:
         """Handle p-value slider change."""
@@ -1169,7 +1504,11 @@ class MainWindow(QMainWindow):
             exponent = -value / 10.0
             pvalue = 10 ** exponent
         self.pvalue_value_label.setText(f"{pvalue:.2e}")
-        self._apply_filters()
+        self._filter_timer.start(75)
+    
+    def _on_filter_changed(self) -> None:
+        """Handle category or carrier selection change with debounce."""
+        self._filter_timer.start(75)
     
     def _on_search_changed(self) -> None:
         """Handle search input change with debounce."""
@@ -1201,40 +1540,55 @@ class MainWindow(QMainWindow):
             return
         
         criteria = self._get_current_filter_criteria()
-        self.filtered_matches = criteria.apply_to_matches(self.all_matches)
+        if criteria == self._last_criteria:
+            return
+        
+        # Column arrays are built on the first filter pass over a result set
+        if self._match_arrays is None or self._match_arrays.matches is not self.all_matches:
+            self._match_arrays = MatchArrays(self.all_matches)
+        self.filtered_indices = criteria.filter_indices(self._match_arrays)
+        self._last_criteria = criteria
         self.current_page = 0
         self._update_table()
     
     def _reset_filters(self) -> None:
         """Reset all filters to default values."""
-        self.score_slider.setValue(0)
-        self.pvalue_slider.setValue(100)
-        self.category_combo.setCurrentIndex(0)
-        self.carrier_combo.setCurrentIndex(0)
-        self.search_input.clear()
-        
-        self.filtered_matches = list(self.all_matches)
-        self.filtered_matches.sort(key=lambda m: m.impact_score, reverse=True)
+        # Signals are blocked so the widgets don't queue filter passes that
+        # the reset below supersedes; the value labels are set by hand instead
+        widgets = (self.score_slider, self.pvalue_slider, self.category_combo,
+                   self.carrier_combo, self.search_input)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.score_slider.setValue(0)
+            self.pvalue_slider.setValue(100)
+            self.category_combo.setCurrentIndex(0)
+            self.carrier_combo.setCurrentIndex(0)
+            self.search_input.clear()
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        self.score_value_label.setText("0.0")
+        self.pvalue_value_label.setText("1.00e+00")
+        # Drop passes queued by edits made before the reset
+        self._filter_timer.stop()
+        self._search_timer.stop()
+        
+        # all_matches is already in score order
+        self.filtered_indices = np.arange(len(self.all_matches))
+        self._last_criteria = self._get_current_filter_criteria()
         self.current_page = 0
         self._update_table()
     
     def _update_table(self) -> None:
         """Update the results table with current filtered data."""
-        total_results = len(self.filtered_matches)
+        total_results = len(self.filtered_indices)
         total_pages = max(1, (total_results + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE)
         
         start_idx = self.current_page * RESULTS_PER_PAGE
         end_idx = min(start_idx + RESULTS_PER_PAGE, total_results)
         
-        page_matches = self.filtered_matches[start_idx:end_idx]
-        
-        self.results_table.setSortingEnabled(False)
-        self.results_table.setRowCount(len(page_matches))
-        
-        for row, match in enumerate(page_matches):
-            self._set_table_row(row, match)
-        
-        self.results_table.setSortingEnabled(True)
+        self.results_model.set_page(self.all_matches, self.filtered_indices, start_idx, end_idx)
         
         # Update labels and pagination
         if total_results > 0:
@@ -1249,67 +1603,20 @@ class MainWindow(QMainWindow):
         self.prev_btn.setEnabled(self.current_page > 0)
         self.next_btn.setEnabled(self.current_page < total_pages - 1)
     
-    def _set_table_row(self, row: int, match: GWASMatch) -> None:
-        """Set data for a single table row."""
-        items = [
-            match.rsid,
-            match.gene or "-",
-            match.trait,
-            match.user_genotype,
-            match.risk_allele,
-            f"{match.p_value:.2e}",
-            match.category,
-            f"{match.impact_score:.2f}",
-            get_score_interpretation(match.impact_score)
-        ]
-        
-        for col, value in enumerate(items):
-            item = QTableWidgetItem(str(value))
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Color coding for impact score
-            if col == 7:
-                if match.impact_score >= 8:
-                    item.setBackground(QColor(255, 200, 200))
-                elif match.impact_score >= 6:
-                    item.setBackground(QColor(255, 230, 200))
-                elif match.impact_score >= 4:
-                    item.setBackground(QColor(255, 255, 200))
-            
-            # Highlight if user has risk allele
-            if col == 3 and match.has_risk_allele():
-                item.setForeground(QColor(180, 0, 0))
-                item.setFont(QFont('Arial', 10, QFont.Weight.Bold))
-            
-            self.results_table.setItem(row, col, item)
-        
-        # Add Explain button in last column
-        explain_btn = QPushButton("🔍 Explain")
-        explain_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5cb85c;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #449d44;
-            }
-        """)
-        explain_btn.clicked.connect(lambda checked, m=match: self._show_explain_dialog(m))
-        self.results_table.setCellWidget(row, 9, explain_btn)
-    
     def _show_explain_dialog(self, match: GWASMatch) -> None:
         """Show the explain dialog for a specific match."""
-        dialog = ExplainDialog(match, self)
-        dialog.exec()
+        # One dialog per window, refilled for each match
+        if self._explain_dialog is None:
+            self._explain_dialog = ExplainDialog(match, self)
+        else:
+            self._explain_dialog.set_match(match)
+        self._explain_dialog.exec()
     
     def _on_help_clicked(self) -> None:
         """Show the help dialog."""
-        dialog = HelpDialog(self)
-        dialog.exec()
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec()
     
     def _on_save_clicked(self) -> None:
         """Save current analysis session to file."""
@@ -1388,7 +1695,7 @@ class MainWindow(QMainWindow):
             
             # Update internal state
             self.snp_records = snp_records
-            self.all_matches = gwas_matches
+            self.all_matches = sorted(gwas_matches, key=lambda m: m.impact_score, reverse=True)
             self.polygenic_results = polygenic_results
             self.current_page = 0
             
@@ -1445,7 +1752,7 @@ class MainWindow(QMainWindow):
     
     def _on_next_page(self) -> None:
         """Go to next page."""
-        total_pages = (len(self.filtered_matches) + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
+        total_pages = (len(self.filtered_indices) + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
         if self.current_page < total_pages - 1:
             self.current_page += 1
             self._update_table()
@@ -5,8 +5,11 @@ Contains dataclasses for SNP records, GWAS matches, and filter criteria.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Dict
 import re
+import sys
+
+import numpy as np
 
 from config import (
     VALID_CHROMOSOMES, 
@@ -15,8 +18,12 @@ from config import (
     TRAIT_CATEGORIES
 )
 
+# Records and matches are created by the hundred thousand; slots drop the
+# per-instance __dict__. dataclass(slots=True) needs Python 3.10+.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SNPRecord:
     """
     Represents a SNP read from a 23andMe raw data file.
@@ -53,7 +60,7 @@ class SNPRecord:
         return f"SNPRecord({self.rsid}, chr{self.chromosome}:{self.position}, {self.genotype})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GWASMatch:
     """
     Represents a match between a user SNP and a GWAS Catalog entry.
@@ -86,6 +93,12 @@ class GWASMatch:
     category: str
     allele_frequency: float
     impact_score: float
+    # Lowercased rsid/gene/trait for the text filter, built once per match
+    _search_blob: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the lowercase text searched by FilterCriteria."""
+        self._search_blob = f"{self.rsid}\n{self.gene or ''}\n{self.trait}".lower()
     
     def __lt__(self, other: 'GWASMatch') -> bool:
         """Enable sorting by impact score (descending)."""
@@ -118,6 +131,16 @@ class GWASMatch:
         return self.user_genotype.count(self.risk_allele)
 
 
+# Sort keys for FilterCriteria.sort_by
+_SORT_KEYS = {
+    'score': lambda m: m.impact_score,
+    'pvalue': lambda m: m.p_value,
+    'trait': lambda m: m.trait.lower(),
+    'gene': lambda m: (m.gene or '').lower(),
+    'rsid': lambda m: m.rsid,
+}
+
+
 @dataclass
 class FilterCriteria:
     """
@@ -162,17 +185,19 @@ class FilterCriteria:
         Returns:
             List[GWASMatch]: Filtered and sorted list.
         """
-        filtered = matches
-        
-        # Filter by minimum score
-        filtered = [m for m in filtered if m.impact_score >= self.min_score]
+        # Thresholds always apply, so they share the first (full) pass
+        min_score = self.min_score
+        max_pvalue = self.max_pvalue
+        category = self.category if self.category != 'ALL' else None
         
-        # Filter by maximum p-value
-        filtered = [m for m in filtered if m.p_value <= self.max_pvalue]
-        
-        # Filter by category
-        if self.category and self.category != 'ALL':
-            filtered = [m for m in filtered if m.category == self.category]
+        # Filter by minimum score, maximum p-value and category
+        if category:
+            filtered = [
+                m for m in matches
+                if m.impact_score >= min_score and m.p_value <= max_pvalue and m.category == category
+            ]
+        else:
+            filtered = [m for m in matches if m.impact_score >= min_score and m.p_value <= max_pvalue]
         
         # Filter by carrier status
         if self.carrier_status and self.carrier_status != 'ALL':
@@ -188,23 +213,97 @@ class FilterCriteria:
         # Filter by search text (case-insensitive)
         if self.search_text:
             search_lower = self.search_text.lower()
-            filtered = [
-                m for m in filtered 
-                if (search_lower in m.trait.lower() or 
-                    (m.gene and search_lower in m.gene.lower()) or
-                    search_lower in m.rsid.lower())
-            ]
-        
-        # Sort results
-        if self.sort_by == 'score':
-            filtered.sort(key=lambda m: m.impact_score, reverse=not self.sort_ascending)
-        elif self.sort_by == 'pvalue':
-            filtered.sort(key=lambda m: m.p_value, reverse=not self.sort_ascending)
-        elif self.sort_by == 'trait':
-            filtered.sort(key=lambda m: m.trait.lower(), reverse=not self.sort_ascending)
-        elif self.sort_by == 'gene':
-            filtered.sort(key=lambda m: (m.gene or '').lower(), reverse=not self.sort_ascending)
-        elif self.sort_by == 'rsid':
-            filtered.sort(key=lambda m: m.rsid, reverse=not self.sort_ascending)
+            filtered = [m for m in filtered if search_lower in m._search_blob]
         
+        self._sort(filtered)
         return filtered
+    
+    def filter_indices(self, arrays: 'MatchArrays') -> np.ndarray:
+        """
+        Apply all filter criteria using the column arrays of a match list.
+        
+        Selects the same matches, in the same order, as
+        apply_to_matches(arrays.matches), with the threshold, category and
+        carrier checks done as array masks.
+        
+        Args:
+            arrays: Column arrays built over the matches to filter.
+        
+        Returns:
+            np.ndarray: Positions in arrays.matches of the filtered and sorted matches.
+        """
+        mask = (arrays.scores >= self.min_score) & (arrays.p_values <= self.max_pvalue)
+        if self.category and self.category != 'ALL':
+            # A category absent from the matches has no code and selects nothing
+            code = arrays.category_codes.get(self.category, -1)
+            mask &= arrays.categories == code
+        
+        if self.carrier_status and self.carrier_status != 'ALL':
+            counts = arrays.risk_counts
+            if self.carrier_status == 'non-carrier':
+                mask &= counts == 0
+            elif self.carrier_status == 'heterozygous':
+                mask &= counts == 1
+            elif self.carrier_status == 'homozygous':
+                mask &= counts == 2
+            elif self.carrier_status == 'carrier':
+                mask &= counts > 0
+        
+        indices = np.flatnonzero(mask)
+        
+        # Substring search has no array form; only rows left by the masks are checked
+        if self.search_text:
+            search_lower = self.search_text.lower()
+            blobs = arrays.search_blobs
+            indices = np.fromiter(
+                (i for i in indices.tolist() if search_lower in blobs[i]), dtype=np.intp
+            )
+        
+        # Numeric sorts are done on the indices; the stable argsort keeps
+        # ties in list order, as list.sort does
+        if self.sort_by in ('score', 'pvalue'):
+            keys = arrays.scores if self.sort_by == 'score' else arrays.p_values
+            keys = keys[indices]
+            return indices[np.argsort(keys if self.sort_ascending else -keys, kind='stable')]
+        
+        matches = arrays.matches
+        key = _SORT_KEYS[self.sort_by]
+        order = sorted(indices.tolist(), key=lambda i: key(matches[i]), reverse=not self.sort_ascending)
+        return np.array(order, dtype=np.intp)
+    
+    def _sort(self, matches: List[GWASMatch]) -> None:
+        """Sort matches in place by the configured column and direction."""
+        matches.sort(key=_SORT_KEYS[self.sort_by], reverse=not self.sort_ascending)
+
+
+class MatchArrays:
+    """
+    Column arrays over a list of matches, used for vectorized filtering.
+    
+    The arrays are built once per result set; the matches list must not be
+    reordered or resized while the arrays are in use.
+    
+    Attributes:
+        matches: The matches the arrays were built from
+        scores: Impact scores (float64)
+        p_values: P-values (float64)
+        categories: Trait category code per match (int32)
+        category_codes: Code for each category name
+        risk_counts: Copies of the risk allele per match (int8)
+        search_blobs: Lowercased search text per match
+    """
+    
+    def __init__(self, matches: List[GWASMatch]) -> None:
+        count = len(matches)
+        self.matches = matches
+        self.scores = np.fromiter((m.impact_score for m in matches), dtype=np.float64, count=count)
+        self.p_values = np.fromiter((m.p_value for m in matches), dtype=np.float64, count=count)
+        # Categories are compared as integer codes; an object array compare
+        # calls str.__eq__ once per match
+        self.category_codes: Dict[str, int] = {}
+        codes = self.category_codes
+        self.categories = np.fromiter(
+            (codes.setdefault(m.category, len(codes)) for m in matches), dtype=np.int32, count=count
+        )
+        self.risk_counts = np.fromiter((m.risk_allele_count() for m in matches), dtype=np.int8, count=count)
+        self.search_blobs = [m._search_blob for m in matches]
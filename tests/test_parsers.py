@@ -136,6 +136,28 @@ rs4970383	1	1019440	TT
         finally:
             os.unlink(path)
     
+    def test_parse_keeps_line_order(self):
+        """Test lines needing the full validator stay in file order."""
+        content = """rs3131972	1	694713	GG
+rs12124819  1  713790  AG
+rs11240777	1	+856331	GG
+rs6681049	1	909917	gg
+rs4970383	1	1019440	TT	extra
+"""
+        path = self._create_temp_file(content)
+        try:
+            parser = Parser23andMe()
+            calls = []
+            parser.set_progress_callback(lambda done, total: calls.append((done, total)))
+            records = parser.parse_file(path)
+            
+            assert [r.rsid for r in records] == ['rs3131972', 'rs12124819', 'rs11240777', 'rs4970383']
+            assert records[2].position == 856331
+            assert parser.get_parse_stats()['warnings'] == ["Line 4: Invalid genotype format 'gg'"]
+            assert calls[-1] == (5, 5)
+        finally:
+            os.unlink(path)
+    
     def test_parse_file_not_found(self):
         """Test that ParseError is raised for missing files."""
         parser = Parser23andMe()
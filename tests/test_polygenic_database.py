@@ -3,6 +3,7 @@ Tests for polygenic database functionality.
 """
 
 import pytest
+import sqlite3
 import os
 import tempfile
 from datetime import datetime
@@ -11,6 +12,7 @@ from models.polygenic_models import (
     PolygenicScore, PolygenicVariant, PopulationDistribution,
     TraitCategory, DatabaseVersion
 )
+from database import polygenic_database
 from database.polygenic_database import (
     PolygenicDatabase, DatabaseVersionManager, PolygenicDatabaseError
 )
@@ -118,6 +120,29 @@ class TestPolygenicDatabase:
         if version:
             assert version.database_name == "pgs_catalog"
     
+    def test_set_version_visible_to_pooled_readers(self, temp_db):
+        """Test a version write is committed before _set_version returns."""
+        db = PolygenicDatabase(temp_db)
+        db.get_version("gwas_catalog")
+        
+        db._set_version("gwas_catalog", "2.0.0", "https://www.ebi.ac.uk/gwas/")
+        
+        version = db.get_version("gwas_catalog")
+        db.close()
+        assert version is not None
+        assert version.version == "2.0.0"
+    
+    def test_set_version_with_batch_timestamp(self, temp_db):
+        """Test a caller-supplied timestamp is stored as the download date."""
+        db = PolygenicDatabase(temp_db)
+        now_iso = "2024-03-01T12:00:00"
+        
+        db._set_version("gwas_catalog", "2.0.0", "https://www.ebi.ac.uk/gwas/", now_iso=now_iso)
+        db._set_version("pgs_catalog", "2.0.0", "https://www.pgscatalog.org/", now_iso=now_iso)
+        
+        assert db.get_version("gwas_catalog").download_date == datetime(2024, 3, 1, 12, 0)
+        assert db.get_version("pgs_catalog").download_date == datetime(2024, 3, 1, 12, 0)
+    
     def test_get_score_count(self, temp_db):
         """Test getting score count."""
         db = PolygenicDatabase(temp_db)
@@ -168,6 +193,137 @@ class TestDatabaseVersionManager:
         backups = manager.list_backups()
         
         assert isinstance(backups, list)
+    
+    def test_list_backups_limit(self, temp_backup_dir, monkeypatch):
+        """Test listing only the most recent backups."""
+        monkeypatch.setattr(polygenic_database, "BACKUP_DIR", temp_backup_dir)
+        manager = DatabaseVersionManager()
+        
+        for i in range(5):
+            path = os.path.join(temp_backup_dir, f"gwas.db.{i}.bak")
+            with open(path, 'w') as f:
+                f.write("backup")
+            os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+        
+        backups = manager.list_backups(limit=2)
+        
+        assert [os.path.basename(p) for p, _ in backups] == ["gwas.db.4.bak", "gwas.db.3.bak"]
+        assert len(manager.list_backups()) == 5
+    
+    def test_get_gwas_version_with_checksum(self, temp_backup_dir):
+        """Test GWAS version is read from a versioned database including checksum."""
+        db_path = os.path.join(temp_backup_dir, "gwas.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE database_versions (
+                database_name TEXT UNIQUE NOT NULL,
+                version TEXT NOT NULL,
+                release_date TEXT,
+                download_date TEXT NOT NULL,
+                source_url TEXT,
+                record_count INTEGER,
+                checksum TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO database_versions VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("gwas_catalog", "2.1.0", None, "2024-01-15T10:00:00",
+             "https://www.ebi.ac.uk/gwas/", 42, "abc123")
+        )
+        conn.commit()
+        conn.close()
+        
+        manager = DatabaseVersionManager()
+        manager.gwas_db_path = db_path
+        
+        version = manager.get_gwas_version()
+        
+        assert version is not None
+        assert version.version == "2.1.0"
+        assert version.record_count == 42
+        assert version.checksum == "abc123"
+    
+    def test_get_gwas_version_legacy_cached(self, temp_backup_dir, monkeypatch):
+        """Test legacy GWAS version is cached until the database file changes."""
+        db_path = os.path.join(temp_backup_dir, "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE gwas_variants (variant_id TEXT)")
+        conn.execute("INSERT INTO gwas_variants VALUES ('rs1')")
+        conn.commit()
+        conn.close()
+        
+        manager = DatabaseVersionManager()
+        manager.gwas_db_path = db_path
+        reads = []
+        load = polygenic_database._load_gwas_version
+        monkeypatch.setattr(
+            polygenic_database, "_load_gwas_version",
+            lambda *args: reads.append(args) or load(*args)
+        )
+        
+        first = manager.get_gwas_version()
+        assert first is not None
+        assert first.record_count == 1
+        
+        second = manager.get_gwas_version()
+        assert second == first
+        assert second is not first
+        assert len(reads) == 1
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO gwas_variants VALUES ('rs2')")
+        conn.commit()
+        conn.close()
+        os.utime(db_path, ns=(0, os.stat(db_path).st_mtime_ns + 1))
+        
+        assert manager.get_gwas_version().record_count == 2
+    
+    def test_get_gwas_version_missing_database(self, temp_backup_dir):
+        """Test missing GWAS database returns None without creating the file."""
+        db_path = os.path.join(temp_backup_dir, "missing.db")
+        manager = DatabaseVersionManager()
+        manager.gwas_db_path = db_path
+        
+        assert manager.get_gwas_version() is None
+        assert not os.path.exists(db_path)
+    
+    def test_get_gwas_version_failed_read_not_cached(self, temp_backup_dir, monkeypatch):
+        """Test a failed read is retried on the next call."""
+        db_path = os.path.join(temp_backup_dir, "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE gwas_variants (variant_id TEXT)")
+        conn.commit()
+        conn.close()
+        manager = DatabaseVersionManager()
+        manager.gwas_db_path = db_path
+        load = polygenic_database._load_gwas_version
+        monkeypatch.setattr(polygenic_database, "_load_gwas_version", lambda *args: None)
+        
+        assert manager.get_gwas_version() is None
+        
+        monkeypatch.setattr(polygenic_database, "_load_gwas_version", load)
+        assert manager.get_gwas_version() is not None
+    
+    def test_get_gwas_version_sees_wal_commits(self, temp_backup_dir):
+        """Test commits still in the WAL file invalidate the cached version."""
+        db_path = os.path.join(temp_backup_dir, "legacy.db")
+        writer = sqlite3.connect(db_path)
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE gwas_variants (variant_id TEXT)")
+        writer.execute("INSERT INTO gwas_variants VALUES ('rs1')")
+        writer.commit()
+        manager = DatabaseVersionManager()
+        manager.gwas_db_path = db_path
+        
+        assert manager.get_gwas_version().record_count == 1
+        
+        writer.execute("INSERT INTO gwas_variants VALUES ('rs2')")
+        writer.commit()
+        count = manager.get_gwas_version().record_count
+        writer.close()
+        
+        assert count == 2
 
 
 class TestDatabaseVersion:
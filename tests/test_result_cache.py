@@ -0,0 +1,121 @@
+"""
+Unit tests for the analysis result cache.
+"""
+
+import pytest
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.result_cache import ResultCache
+from models.data_models import SNPRecord, GWASMatch
+
+
+class RemovedClass:
+    """Stands in for a class that no longer exists when a cache entry is read."""
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Provide a cache in a temporary directory."""
+        return ResultCache(str(tmp_path / "cache.db"), max_entries=2)
+    
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Provide a genotype file and a database file."""
+        genotype_path = tmp_path / "genome.txt"
+        genotype_path.write_text("rs123\t1\t100\tAG\n")
+        db_path = tmp_path / "gwas.db"
+        db_path.write_bytes(b"db")
+        return str(genotype_path), str(db_path)
+    
+    @pytest.fixture
+    def results(self):
+        """Provide sample records, matches and stats."""
+        records = [SNPRecord(rsid="rs123", chromosome="1", position=100, genotype="AG")]
+        matches = [GWASMatch(
+            rsid="rs123", chromosome="1", position=100, user_genotype="AG",
+            gene="GENE1", trait="Type 2 diabetes", risk_allele="A",
+            p_value=1e-10, odds_ratio=1.5, sample_size=10000,
+            category="Metabolic", allele_frequency=0.3, impact_score=9.0
+        )]
+        return records, matches, {'total_lines': 1, 'matches_found': 1}
+    
+    def test_round_trip(self, cache, files, results):
+        """Test a stored analysis is returned unchanged."""
+        key = ResultCache.make_key(*files)
+        
+        assert cache.get(key) is None
+        assert cache.put(key, *results) is True
+        
+        records, matches, stats = cache.get(key)
+        assert (records, matches, stats) == results
+        assert matches[0]._search_blob == results[1][0]._search_blob
+    
+    def test_key_follows_contents(self, files, tmp_path):
+        """Test the key depends on file contents and the database, not the file name."""
+        genotype_path, db_path = files
+        copy_path = tmp_path / "copy.txt"
+        copy_path.write_bytes(open(genotype_path, 'rb').read())
+        key = ResultCache.make_key(genotype_path, db_path)
+        
+        assert ResultCache.make_key(str(copy_path), db_path) == key
+        
+        copy_path.write_text("rs123\t1\t100\tAA\n")
+        assert ResultCache.make_key(str(copy_path), db_path) != key
+        
+        with open(db_path, 'ab') as f:
+            f.write(b"updated")
+        assert ResultCache.make_key(genotype_path, db_path) != key
+    
+    def test_evicts_least_recently_used(self, cache, results):
+        """Test only the most recently used entries are kept."""
+        cache.put("a", *results)
+        time.sleep(0.01)
+        cache.put("b", *results)
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", *results)
+        
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+    
+    def test_unreadable_cache_is_a_miss(self, tmp_path, results):
+        """Test a corrupt cache file is treated as a miss."""
+        cache_path = tmp_path / "cache.db"
+        cache_path.write_bytes(b"not a database" * 100)
+        cache = ResultCache(str(cache_path))
+        
+        assert cache.get("key") is None
+        assert cache.put("key", *results) is False
+    
+    def test_stale_entry_is_a_miss(self, cache, results, monkeypatch):
+        """Test an entry that no longer unpickles is a miss and is removed."""
+        records, matches, stats = results
+        cache.put("key", records, matches, {'layout': RemovedClass()})
+        monkeypatch.delattr(sys.modules[__name__], "RemovedClass")
+        
+        assert cache.get("key") is None
+        
+        conn = sqlite3.connect(cache.cache_path)
+        count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        conn.close()
+        assert count == 0
+    
+    def test_unpicklable_results_are_not_stored(self, cache, results):
+        """Test any pickling failure is reported as not stored."""
+        records, matches, stats = results
+        
+        class LocalClass:
+            pass
+        
+        assert cache.put("key", records, matches, {'layout': LocalClass()}) is False
+        assert cache.get("key") is None
@@ -11,7 +11,7 @@ import sqlite3
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.search_engine import SearchEngine, DatabaseError
-from models.data_models import SNPRecord, GWASMatch, FilterCriteria
+from models.data_models import SNPRecord, GWASMatch, FilterCriteria, MatchArrays
 
 
 def create_test_database(db_path: str) -> None:
@@ -157,6 +157,28 @@ class TestSearchEngine:
         assert "rs1333049" in rsids
         assert "rs9999999" not in rsids
     
+    def test_match_reports_progress(self, search_engine):
+        """Test progress is reported per batch up to the full SNP count."""
+        user_snps = [
+            SNPRecord(rsid=f"rs{i}", chromosome="1", position=i + 1, genotype="AA")
+            for i in range(1200)
+        ]
+        calls = []
+        
+        search_engine.match_user_snps(user_snps, progress_callback=lambda i, n: calls.append((i, n)))
+        
+        assert calls == [(500, 1200), (1000, 1200), (1200, 1200)]
+    
+    def test_match_cancelled(self, search_engine):
+        """Test matching stops before the next batch once cancelled."""
+        user_snps = [
+            SNPRecord(rsid="rs6983267", chromosome="8", position=128413305, genotype="GG"),
+        ]
+        
+        matches = search_engine.match_user_snps(user_snps, should_cancel=lambda: True)
+        
+        assert matches == []
+    
     def test_match_includes_user_genotype(self, search_engine):
         """Test that matches include the user's genotype."""
         user_snps = [
@@ -291,6 +313,10 @@ class TestFilterCriteria:
         criteria = FilterCriteria(search_text="HEART")
         filtered = criteria.apply_to_matches(sample_matches)
         assert len(filtered) == 1
+        
+        # Search in rsid, never across field boundaries
+        assert len(FilterCriteria(search_text="RS003").apply_to_matches(sample_matches)) == 1
+        assert FilterCriteria(search_text="gene1 type").apply_to_matches(sample_matches) == []
     
     def test_sort_by_score_descending(self, sample_matches):
         """Test sorting by impact score descending."""
@@ -339,6 +365,21 @@ class TestFilterCriteria:
         assert all(m.impact_score >= 4.0 for m in filtered)
         assert all(m.p_value <= 1e-5 for m in filtered)
     
+    def test_array_filter_matches_list_filter(self, sample_matches):
+        """Test filtering through column arrays selects the same matches as the list filter."""
+        arrays = MatchArrays(sample_matches)
+        criteria_list = [
+            FilterCriteria(),
+            FilterCriteria(min_score=5.0, max_pvalue=1e-8),
+            FilterCriteria(category='Metabolic', carrier_status='carrier'),
+            FilterCriteria(carrier_status='non-carrier', sort_by='pvalue', sort_ascending=True),
+            FilterCriteria(search_text='E', sort_by='trait'),
+        ]
+        
+        for criteria in criteria_list:
+            filtered = [sample_matches[i] for i in criteria.filter_indices(arrays)]
+            assert filtered == criteria.apply_to_matches(sample_matches)
+    
     def test_filter_returns_empty_list(self, sample_matches):
         """Test that impossible filters return empty list."""
         criteria = FilterCriteria(min_score=9.5)  # Higher than any sample match
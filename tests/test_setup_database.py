@@ -0,0 +1,248 @@
+"""
+Unit tests for the GWAS database setup script.
+"""
+
+import pytest
+import tempfile
+import os
+import sys
+import sqlite3
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.setup_database import (
+    create_database, verify_database, install_seed_database, build_seed_database
+)
+
+
+class TestCreateDatabase:
+    """Tests for create_database and verify_database."""
+    
+    @pytest.fixture
+    def db_path(self):
+        """Provide a path inside a temporary directory."""
+        with tempfile.TemporaryDirectory() as d:
+            yield os.path.join(d, "gwas.db")
+    
+    def test_create_database(self, db_path):
+        """Test database is created with sample data."""
+        assert create_database(db_path) is True
+        assert verify_database(db_path) is True
+        
+        conn = sqlite3.connect(db_path)
+        variant_count = conn.execute("SELECT COUNT(*) FROM gwas_variants").fetchone()[0]
+        af_count = conn.execute("SELECT COUNT(*) FROM allele_frequencies").fetchone()[0]
+        conn.close()
+        
+        assert variant_count > 0
+        assert af_count > 0
+    
+    def test_create_database_fts(self, db_path):
+        """Test full-text index is populated."""
+        create_database(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT variant_id FROM gwas_fts WHERE gwas_fts MATCH 'TCF7L2'"
+        ).fetchall()
+        conn.close()
+        
+        assert ("rs7903146",) in rows
+    
+    def test_fts_follows_variant_updates(self, db_path):
+        """Test triggers keep the full-text index in sync with the variant tables."""
+        create_database(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "UPDATE variants SET mapped_gene = 'NEWGENE' WHERE variant_id = 'rs6983267'"
+        )
+        conn.commit()
+        
+        new_rows = conn.execute(
+            "SELECT variant_id FROM gwas_fts WHERE gwas_fts MATCH 'NEWGENE'"
+        ).fetchall()
+        conn.execute("DELETE FROM variant_trait_assoc WHERE variant_id = 'rs6983267'")
+        conn.commit()
+        deleted_rows = conn.execute(
+            "SELECT variant_id FROM gwas_fts WHERE gwas_fts MATCH 'NEWGENE'"
+        ).fetchall()
+        conn.close()
+        
+        assert new_rows == [("rs6983267",)]
+        assert deleted_rows == []
+    
+    def test_variants_stored_once(self, db_path):
+        """Test variants with several trait associations are stored once."""
+        create_database(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        variant_rows = conn.execute(
+            "SELECT COUNT(*) FROM variants WHERE variant_id = 'rs7903146'"
+        ).fetchone()[0]
+        joined_rows = conn.execute(
+            "SELECT chromosome, position, mapped_gene FROM gwas_variants WHERE variant_id = 'rs7903146'"
+        ).fetchall()
+        conn.close()
+        
+        assert variant_rows == 1
+        assert joined_rows == [("10", 114758349, "TCF7L2")] * 3
+    
+    def test_migrates_legacy_table(self, db_path):
+        """Test a pre-split gwas_variants table is migrated into the new tables."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE gwas_variants (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                variant_id TEXT NOT NULL,
+                chromosome TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                ref_allele TEXT,
+                alt_allele TEXT,
+                risk_allele TEXT,
+                reported_trait TEXT NOT NULL,
+                mapped_gene TEXT,
+                p_value REAL NOT NULL,
+                odds_ratio REAL,
+                sample_size INTEGER,
+                category TEXT,
+                pubmed_id TEXT,
+                UNIQUE(variant_id, reported_trait)
+            )
+        """)
+        conn.execute("""
+            INSERT INTO gwas_variants
+            (variant_id, chromosome, position, risk_allele, reported_trait, mapped_gene, p_value, category)
+            VALUES ('rs999', '1', 1000, 'A', 'Custom trait', 'GENE1', 1e-9, 'Other')
+        """)
+        conn.commit()
+        conn.close()
+        
+        assert create_database(db_path) is True
+        
+        conn = sqlite3.connect(db_path)
+        object_type = conn.execute(
+            "SELECT type FROM sqlite_master WHERE name = 'gwas_variants'"
+        ).fetchone()[0]
+        migrated = conn.execute(
+            "SELECT reported_trait, mapped_gene FROM gwas_variants WHERE variant_id = 'rs999'"
+        ).fetchall()
+        conn.close()
+        
+        assert object_type == "view"
+        assert migrated == [("Custom trait", "GENE1")]
+    
+    def test_significance_index_used(self, db_path):
+        """Test category + significance filters use the partial index."""
+        create_database(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT variant_id FROM variant_trait_assoc "
+            "WHERE category = 'Oncology' AND p_value < 5e-8"
+        ).fetchall()
+        has_stats = conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+        conn.close()
+        
+        assert any("idx_cat_pval" in row[-1] for row in plan)
+        assert has_stats
+    
+    def test_create_database_wal(self, db_path):
+        """Test database is left in WAL journal mode with the configured page size."""
+        create_database(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        conn.close()
+        
+        assert mode == "wal"
+        assert page_size == 8192
+    
+    def test_create_database_drop_existing(self, db_path):
+        """Test recreating the database does not duplicate rows."""
+        create_database(db_path)
+        conn = sqlite3.connect(db_path)
+        before = conn.execute("SELECT COUNT(*) FROM gwas_variants").fetchone()[0]
+        conn.close()
+        
+        assert create_database(db_path, drop_existing=True) is True
+        
+        conn = sqlite3.connect(db_path)
+        after = conn.execute("SELECT COUNT(*) FROM gwas_variants").fetchone()[0]
+        conn.close()
+        
+        assert after == before
+    
+    def test_create_database_rolls_back_on_error(self, db_path):
+        """Test a failed build leaves no partially created tables behind."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE allele_frequencies (variant_id TEXT)")
+        conn.commit()
+        conn.close()
+        
+        assert create_database(db_path) is False
+        
+        conn = sqlite3.connect(db_path)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+        
+        assert "gwas_variants" not in tables
+    
+    def test_seed_sql_up_to_date(self, tmp_path):
+        """Test the committed seed.sql matches the sample data source."""
+        from database.seed_data import build_seed_sql
+        from database.setup_database import SEED_SQL_PATH
+        
+        generated = tmp_path / "seed.sql"
+        build_seed_sql(str(generated))
+        
+        with open(SEED_SQL_PATH, encoding='utf-8') as f:
+            assert generated.read_text(encoding='utf-8') == f.read()
+    
+    def test_seed_database_matches_build(self, db_path, tmp_path):
+        """Test the committed seed database matches a build from seed.sql."""
+        built_path = str(tmp_path / "built.db")
+        assert create_database(built_path, use_seed=False) is True
+        assert install_seed_database(db_path) is True
+        
+        def dump(path):
+            conn = sqlite3.connect(path)
+            schema = conn.execute(
+                "SELECT type, name, sql FROM sqlite_master WHERE name NOT LIKE 'sqlite_%' ORDER BY name"
+            ).fetchall()
+            variants = conn.execute("SELECT * FROM gwas_variants ORDER BY id").fetchall()
+            freqs = conn.execute("SELECT * FROM allele_frequencies ORDER BY variant_id").fetchall()
+            conn.close()
+            return schema, variants, freqs
+        
+        assert dump(db_path) == dump(built_path)
+    
+    def test_install_seed_existing_file(self, db_path):
+        """Test the seed is never copied over an existing file."""
+        with open(db_path, 'w') as f:
+            f.write("")
+        
+        assert install_seed_database(db_path) is False
+    
+    def test_build_seed_database(self, db_path, tmp_path):
+        """Test a rebuilt seed installs a working database."""
+        seed_path = str(tmp_path / "seed.db.gz")
+        
+        assert build_seed_database(seed_path) is True
+        assert install_seed_database(db_path, seed_path) is True
+        assert verify_database(db_path) is True
+    
+    def test_verify_database_empty(self, db_path):
+        """Test a database without variant rows is not considered valid."""
+        create_database(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM variant_trait_assoc")
+        conn.commit()
+        conn.close()
+        
+        assert verify_database(db_path) is False
+    
+    def test_verify_database_missing(self, db_path):
+        """Test verifying a missing database."""
+        assert verify_database(db_path) is False
@@ -0,0 +1,545 @@
+"""
+Unit tests for the database update script.
+"""
+
+import pytest
+import pandas as pd
+import json
+import os
+import sys
+import sqlite3
+import gzip
+import zipfile
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import update_databases
+
+
+SCORING_FILE_LINES = [
+    "###PGS CATALOG SCORING FILE\n",
+    "#pgs_id=PGS000001\n",
+    "rsID\tchr_name\tchr_position\teffect_allele\tother_allele\teffect_weight\tallelefrequency_effect\n",
+    "rs1\t1\t100\tA\tG\t0.5\t0.2\n",
+    "rs2\t2\tNA\tC\tT\t-0.25\tNA\n",
+    "rs3\t3\t300\tG\tA\tnot_a_number\t0.1\n",
+]
+
+
+class TestState:
+    """Tests for update state persistence."""
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_state_round_trip(self, tmp_path, monkeypatch, use_orjson):
+        """Test saved state loads back unchanged with either JSON backend."""
+        if use_orjson and update_databases.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(update_databases, "orjson", None)
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        
+        state = update_databases.load_state()
+        state["pgs"]["processed_scores"].update({"PGS000002", "PGS000001"})
+        state["gwas"]["status"] = "complete"
+        update_databases.save_state(state)
+        
+        assert update_databases.load_state() == state
+        with open(tmp_path / "state.json") as f:
+            saved = json.load(f)
+        assert saved["pgs"]["processed_scores"] == ["PGS000001", "PGS000002"]
+    
+    def test_corrupt_state_falls_back_to_default(self, tmp_path, monkeypatch):
+        """Test an unreadable state file yields a fresh state."""
+        state_file = tmp_path / "state.json"
+        state_file.write_text("{not json")
+        monkeypatch.setattr(update_databases, "STATE_FILE", state_file)
+        
+        state = update_databases.load_state()
+        
+        assert state["gwas"]["status"] == "never"
+        assert state["pgs"]["processed_scores"] == set()
+
+
+class TestFormatting:
+    """Tests for progress formatting helpers."""
+    
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "0s"),
+        (59.9, "59s"),
+        (60, "1m 0s"),
+        (3599, "59m 59s"),
+        (3600, "1h 0m"),
+        (7384, "2h 3m"),
+    ])
+    def test_format_time(self, seconds, expected):
+        """Test seconds are formatted with the largest sensible units."""
+        assert update_databases.format_time(seconds) == expected
+    
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (5 * 1024 ** 3, "5.0 GB"),
+        (2048 * 1024 ** 4, "2048.0 TB"),
+    ])
+    def test_format_size(self, size, expected):
+        """Test byte counts are formatted with binary units."""
+        assert update_databases.format_size(size) == expected
+
+
+class TestMapColumns:
+    """Tests for header alias resolution."""
+    
+    def test_first_alias_wins(self):
+        """Test the preferred alias is used even when it appears later."""
+        header = ["beta", "chr", "effect_weight", "rsid"]
+        
+        col_map = update_databases._map_columns(header, update_databases.PGS_COLUMN_ALIASES)
+        
+        assert col_map == {'weight': 2, 'chromosome': 1, 'rsid': 3}
+
+
+class TestParseGwasChunk:
+    """Tests for vectorized GWAS TSV field parsing."""
+    
+    COL_INDICES = {
+        'rsid': 0, 'chromosome': 1, 'position': 2, 'p_value': 3, 'odds_ratio': None,
+        'trait': 4, 'trait_uri': None, 'study_accession': None, 'pubmed_id': None,
+        'first_author': None, 'sample_size': 5, 'risk_frequency': 6,
+    }
+    
+    def test_parse_chunk(self):
+        """Test fields are coerced and missing markers map to None."""
+        chunk = pd.DataFrame([
+            ["rs1-A", " 1 ", "100", "1e-9", " Trait ", "2e3", "NA"],
+            ["rs2", "NR", "1.9", "NR", "", "bad", "0.25"],
+            ["chr1:100", "1", "1", "1", "x", "1", "1"],
+            ["", "1", "1", "1", "x", "1", "1"],
+            ["rs3", "NA", None, None, None, None, None],
+        ])
+        
+        rows = update_databases._parse_gwas_chunk(chunk, self.COL_INDICES)
+        
+        assert update_databases.gwas_insert_columns(self.COL_INDICES) == (
+            "rsid", "chromosome", "position", "p_value", "trait", "sample_size", "risk_frequency"
+        )
+        assert rows == [
+            ("rs1", "1", 100, 1e-9, "Trait", 2000, None),
+            ("rs2", None, 1, None, None, None, 0.25),
+            ("rs3", "NA", None, None, None, None, None),
+        ]
+        assert type(rows[0][2]) is int
+    
+    def test_missing_rsid_column(self):
+        """Test no rows are kept when the file has no rsID column."""
+        chunk = pd.DataFrame([["1", "100"]])
+        col_indices = dict.fromkeys(self.COL_INDICES)
+        
+        assert update_databases._parse_gwas_chunk(chunk, col_indices) == []
+
+
+class TestParseScoringFile:
+    """Tests for PGS scoring file parsing."""
+    
+    def test_parse_variants(self):
+        """Test variants are parsed and malformed weights skipped."""
+        variants = update_databases._parse_scoring_file(iter(SCORING_FILE_LINES))
+        
+        assert variants == [
+            ('rs1', '1', 100, 'A', 'G', 0.5, 0.2),
+            ('rs2', '2', None, 'C', 'T', -0.25, None),
+        ]
+    
+    def test_unused_trailing_columns(self):
+        """Test columns after the last mapped one are ignored and unmapped fields are None."""
+        lines = [
+            "effect_weight\tchr_name\tnote\textra\n",
+            "0.5\t1\tfree\ttext\twith\ttabs\n",
+        ]
+        
+        variants = update_databases._parse_scoring_file(iter(lines))
+        
+        assert variants == [(None, '1', None, None, None, 0.5, None)]
+    
+    def test_missing_weight_column(self):
+        """Test files without a weight column are rejected."""
+        lines = ["rsID\tchr_name\n", "rs1\t1\n"]
+        
+        assert update_databases._parse_scoring_file(iter(lines)) is None
+    
+    def test_empty_file(self):
+        """Test files with only comments are rejected."""
+        assert update_databases._parse_scoring_file(iter(["#comment\n"])) is None
+
+
+class TestBatchInsert:
+    """Tests for multi-row VALUES inserts."""
+    
+    def test_batch_insert_chunks(self):
+        """Test rows spanning several chunks are all inserted in order."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+        rows = [(i, f"row{i}") for i in range(7)]
+        
+        update_databases.batch_insert(conn.cursor(), "t", ("a", "b"), rows, chunk=3)
+        
+        assert conn.execute("SELECT a, b FROM t ORDER BY a").fetchall() == rows
+        conn.close()
+    
+    def test_batch_insert_respects_variable_limit(self, monkeypatch):
+        """Test oversized chunks are split to stay under the parameter limit."""
+        monkeypatch.setattr(update_databases, "SQLITE_MAX_VARIABLES", 5)
+        conn = sqlite3.connect(":memory:")
+        conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 5)
+        conn.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+        rows = [(i, f"row{i}") for i in range(7)]
+        
+        update_databases.batch_insert(conn.cursor(), "t", ("a", "b"), rows, chunk=500)
+        
+        assert conn.execute("SELECT a, b FROM t ORDER BY a").fetchall() == rows
+        conn.close()
+    
+    def test_batch_insert_generator(self):
+        """Test rows can be streamed from a generator."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+        
+        update_databases.batch_insert(
+            conn.cursor(), "t", ("a", "b"), ((i, f"row{i}") for i in range(7)), chunk=3
+        )
+        
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 7
+        conn.close()
+    
+    def test_batch_insert_empty(self):
+        """Test inserting no rows is a no-op."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (a INTEGER)")
+        
+        update_databases.batch_insert(conn.cursor(), "t", ("a",), [])
+        
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        conn.close()
+
+
+class TestPreallocate:
+    """Tests for database file preallocation."""
+    
+    def test_preallocate_grows_file(self, tmp_path):
+        """Test the file is extended and the space is left free for reuse."""
+        db_path = tmp_path / "test.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        
+        update_databases.preallocate_database(conn, 1024 * 1024)
+        
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        conn.close()
+        
+        assert os.path.getsize(db_path) >= 1024 * 1024
+        assert free_pages > 0
+        assert tables == [("t",)]
+    
+    def test_preallocate_noop_when_large_enough(self, tmp_path):
+        """Test nothing is written when the file is already big enough."""
+        db_path = tmp_path / "test.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        size = os.path.getsize(db_path)
+        
+        update_databases.preallocate_database(conn, 1)
+        conn.close()
+        
+        assert os.path.getsize(db_path) == size
+    
+    def test_preallocate_caps_oversized_estimate(self, tmp_path, monkeypatch):
+        """Test estimates above the blob size limit are capped and split into rows."""
+        monkeypatch.setattr(update_databases, "PREALLOCATE_MAX_BYTES", 256 * 1024)
+        monkeypatch.setattr(update_databases, "PREALLOCATE_BLOB_BYTES", 64 * 1024)
+        db_path = tmp_path / "test.db"
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        conn.setlimit(sqlite3.SQLITE_LIMIT_LENGTH, 100 * 1024)
+        conn.execute("CREATE TABLE t (x)")
+        
+        update_databases.preallocate_database(conn, 2_000_000_000)
+        conn.close()
+        
+        assert 256 * 1024 <= os.path.getsize(db_path) < 512 * 1024
+
+
+class TestBulkConnection:
+    """Tests for the bulk-load connection settings."""
+    
+    def test_open_bulk_connection(self, tmp_path):
+        """Test the connection is in autocommit mode with relaxed syncing."""
+        conn = update_databases.open_bulk_connection(tmp_path / "bulk.db")
+        
+        assert conn.isolation_level is None
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests response."""
+    
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.headers = {'content-length': str(len(payload))}
+        self.raw = BytesIO(payload)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        pass
+    
+    def raise_for_status(self) -> None:
+        pass
+    
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.payload), chunk_size):
+            yield self.payload[i:i + chunk_size]
+
+
+class FakeSession:
+    """Session stand-in recording requested URLs."""
+    
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.urls = []
+    
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return FakeResponse(self.payload)
+
+
+class TestDownloadScoringFile:
+    """Tests for downloading PGS scoring files."""
+    
+    @pytest.mark.parametrize("use_isal", [True, False])
+    def test_download_with_session(self, monkeypatch, use_isal):
+        """Test the given session is used and the gzipped file is parsed."""
+        if use_isal and update_databases.igzip is None:
+            pytest.skip("isal not installed")
+        if not use_isal:
+            monkeypatch.setattr(update_databases, "igzip", None)
+        session = FakeSession(gzip.compress("".join(SCORING_FILE_LINES).encode()))
+        
+        variants = update_databases.download_pgs_scoring_file("PGS000001", session=session)
+        
+        assert [v[0] for v in variants] == ['rs1', 'rs2']
+        assert session.urls[0].endswith("/PGS000001.txt.gz")
+    
+    def test_download_failure_returns_none(self):
+        """Test a failed request yields None instead of raising."""
+        class BrokenSession:
+            def get(self, url, **kwargs):
+                raise update_databases.requests.ConnectionError("offline")
+        
+        assert update_databases.download_pgs_scoring_file("PGS000001", session=BrokenSession()) is None
+
+
+class TestUpdateGwas:
+    """Tests for the GWAS bulk import."""
+    
+    @pytest.fixture
+    def gwas_zip(self):
+        """Build a small GWAS Catalog style ZIP archive."""
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('associations.tsv', (
+                "SNPS\tCHR_ID\tCHR_POS\tP-VALUE\tDISEASE/TRAIT\n"
+                "rs1\t1\t100\t1e-9\tTrait one\n"
+                "rs2-A\t2\t200\t2e-8\tTrait two\n"
+                "not_an_rsid\t3\t300\t0.5\tTrait three\n"
+            ))
+        return buf.getvalue()
+    
+    def test_update_gwas(self, tmp_path, monkeypatch, gwas_zip):
+        """Test associations are parsed from the streamed archive."""
+        monkeypatch.setattr(update_databases, "GWAS_DB", tmp_path / "gwas.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases.SESSION, "get", lambda *a, **k: FakeResponse(gwas_zip))
+        state = update_databases.load_state()
+        
+        assert update_databases.update_gwas(state) is True
+        
+        conn = sqlite3.connect(tmp_path / "gwas.db")
+        rows = conn.execute(
+            "SELECT rsid, chromosome, position, p_value, trait FROM gwas_associations ORDER BY rsid"
+        ).fetchall()
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'gwas_associations'"
+        )}
+        conn.close()
+        
+        assert rows == [
+            ("rs1", "1", 100, 1e-9, "Trait one"),
+            ("rs2", "2", 200, 2e-8, "Trait two"),
+        ]
+        assert state["gwas"]["associations"] == 2
+        assert len(state["gwas"]["checksum"]) == 64
+        assert set(update_databases.GWAS_INDEXES) <= indexes
+    
+    def test_update_gwas_crlf(self, tmp_path, monkeypatch):
+        """Test CRLF line endings and non-ASCII text are read cleanly."""
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('associations.tsv', "SNPS\tDISEASE/TRAIT\r\nrs1\tTrait \u00e9\r\n")
+        monkeypatch.setattr(update_databases, "GWAS_DB", tmp_path / "gwas.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases.SESSION, "get", lambda *a, **k: FakeResponse(buf.getvalue()))
+        
+        assert update_databases.update_gwas(update_databases.load_state()) is True
+        
+        conn = sqlite3.connect(tmp_path / "gwas.db")
+        rows = conn.execute("SELECT rsid, trait FROM gwas_associations").fetchall()
+        conn.close()
+        
+        assert rows == [("rs1", "Trait \u00e9")]
+    
+    def test_update_gwas_counts_dropped_lines(self, tmp_path, monkeypatch, capsys):
+        """Test lines the parser drops are included in the skipped count."""
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('associations.tsv', "SNPS\tDISEASE/TRAIT\nrs1\tA\n\nnot_an_rsid\tB\nrs2\tC")
+        monkeypatch.setattr(update_databases, "GWAS_DB", tmp_path / "gwas.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases.SESSION, "get", lambda *a, **k: FakeResponse(buf.getvalue()))
+        
+        assert update_databases.update_gwas(update_databases.load_state()) is True
+        
+        output = capsys.readouterr().out
+        assert "Inserted: 2 associations" in output
+        assert "Skipped: 2 rows" in output
+    
+    def test_update_gwas_unknown_columns(self, tmp_path, monkeypatch):
+        """Test a header with no known columns fails and keeps the existing rows."""
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('associations.tsv', "FOO\tBAR\nrs1\tx\n")
+        monkeypatch.setattr(update_databases, "GWAS_DB", tmp_path / "gwas.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases.SESSION, "get", lambda *a, **k: FakeResponse(buf.getvalue()))
+        update_databases.init_gwas_db()
+        conn = sqlite3.connect(tmp_path / "gwas.db")
+        conn.execute("INSERT INTO gwas_associations (rsid) VALUES ('rs1')")
+        conn.commit()
+        conn.close()
+        
+        assert update_databases.update_gwas(update_databases.load_state()) is False
+        
+        conn = sqlite3.connect(tmp_path / "gwas.db")
+        count = conn.execute("SELECT COUNT(*) FROM gwas_associations").fetchone()[0]
+        conn.close()
+        
+        assert count == 1
+    
+    def test_update_gwas_rerun(self, tmp_path, monkeypatch, gwas_zip):
+        """Test a second import replaces the rows and rebuilds the indexes."""
+        monkeypatch.setattr(update_databases, "GWAS_DB", tmp_path / "gwas.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases.SESSION, "get", lambda *a, **k: FakeResponse(gwas_zip))
+        state = update_databases.load_state()
+        
+        assert update_databases.update_gwas(state) is True
+        assert update_databases.update_gwas(state) is True
+        
+        conn = sqlite3.connect(tmp_path / "gwas.db")
+        count = conn.execute("SELECT COUNT(*) FROM gwas_associations").fetchone()[0]
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM gwas_associations WHERE rsid = 'rs1'"
+        ).fetchall()
+        conn.close()
+        
+        assert count == 2
+        assert any("idx_gwas_rsid" in row[-1] for row in plan)
+
+
+class TestRateLimiter:
+    """Tests for the shared download rate limiter."""
+    
+    def test_acquire_spaces_calls(self, monkeypatch):
+        """Test consecutive acquires are spaced by the rate interval."""
+        clock = {'now': 100.0}
+        sleeps = []
+        monkeypatch.setattr(update_databases.time, "monotonic", lambda: clock['now'])
+        monkeypatch.setattr(update_databases.time, "sleep", sleeps.append)
+        limiter = update_databases.RateLimiter(2.0)
+        
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+        
+        assert sleeps == [0.5, 1.0]
+
+
+class TestBoundedAsCompleted:
+    """Tests for the bounded download pipeline."""
+    
+    def test_limits_pending_work(self):
+        """Test no more than max_pending calls are outstanding at once."""
+        submitted = []
+        results = []
+        
+        def work(item):
+            submitted.append(item)
+            return item * 2
+        
+        with update_databases.ThreadPoolExecutor(max_workers=2) as executor:
+            for item, future in update_databases._bounded_as_completed(executor, work, range(1, 11), 3):
+                assert len(submitted) - len(results) <= 3
+                results.append((item, future.result()))
+        
+        assert sorted(results) == [(i, i * 2) for i in range(1, 11)]
+
+
+class TestUpdatePgs:
+    """Tests for the PGS Catalog import."""
+    
+    @pytest.mark.parametrize("commit_interval", [1, 2, 50])
+    def test_update_pgs(self, tmp_path, monkeypatch, commit_interval):
+        """Test downloaded scores are stored and recorded in state."""
+        scores = [
+            {'id': 'PGS000001', 'variants_number': 2, 'trait_reported': 'Trait A'},
+            {'id': 'PGS000002', 'variants_number': 1, 'trait_reported': 'Trait B'},
+            {'id': 'PGS000003', 'variants_number': 1, 'trait_reported': 'Trait C'},
+        ]
+        variants = {
+            'PGS000001': update_databases._parse_scoring_file(iter(SCORING_FILE_LINES)),
+            'PGS000002': update_databases._parse_scoring_file(iter(SCORING_FILE_LINES[:4])),
+            'PGS000003': None,
+        }
+        monkeypatch.setattr(update_databases, "PGS_DB", tmp_path / "pgs.db")
+        monkeypatch.setattr(update_databases, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(update_databases, "REQUEST_DELAY", 0.001)
+        monkeypatch.setattr(update_databases, "PGS_COMMIT_INTERVAL", commit_interval)
+        monkeypatch.setattr(update_databases, "get_all_pgs_metadata", lambda: scores)
+        monkeypatch.setattr(
+            update_databases, "download_pgs_scoring_file",
+            lambda pgs_id, limiter=None, session=None: variants[pgs_id]
+        )
+        state = update_databases.load_state()
+        state["pgs"]["failed_scores"].add('PGS000001')  # failed on an earlier run
+        
+        assert update_databases.update_pgs(state) is True
+        
+        conn = sqlite3.connect(tmp_path / "pgs.db")
+        counts = dict(conn.execute(
+            "SELECT pgs_id, COUNT(*) FROM pgs_variants GROUP BY pgs_id"
+        ).fetchall())
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pgs_variants'"
+        )}
+        conn.close()
+        
+        assert counts == {'PGS000001': 2, 'PGS000002': 1}
+        assert state["pgs"]["processed_scores"] == {'PGS000001', 'PGS000002'}
+        assert state["pgs"]["failed_scores"] == {'PGS000003'}
+        assert {"idx_pgs_variants_pgs_id", "idx_pgs_variants_rsid"} <= indexes